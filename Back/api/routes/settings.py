@@ -7,7 +7,7 @@ from pydantic import BaseModel
 
 from config import config
 from api.schemas.settings import SettingsResponse, SettingsUpdate
-from services.settings_store import save_persisted_settings
+from services.settings_store import read_persisted_settings, save_persisted_settings, update_persisted_values
 from database import DBService
 
 
@@ -100,12 +100,16 @@ async def update_settings(data: SettingsUpdate):
         updated_fields['leave_alert_threshold'] = data.leave_alert_threshold
     if data.class_start_time is not None:
         config.CLASS_START_TIME = data.class_start_time
+        updated_fields['class_start_time'] = data.class_start_time
     if data.class_end_time is not None:
         config.CLASS_END_TIME = data.class_end_time
+        updated_fields['class_end_time'] = data.class_end_time
     if data.lunch_start_time is not None:
         config.LUNCH_START_TIME = data.lunch_start_time
+        updated_fields['lunch_start_time'] = data.lunch_start_time
     if data.lunch_end_time is not None:
         config.LUNCH_END_TIME = data.lunch_end_time
+        updated_fields['lunch_end_time'] = data.lunch_end_time
     if data.daily_reset_time is not None:
         config.DAILY_RESET_TIME = data.daily_reset_time
         updated_fields['daily_reset_time'] = data.daily_reset_time
@@ -268,18 +272,10 @@ class IgnoreKeywordsUpdate(BaseModel):
 @router.get("/ignore-keywords", response_model=IgnoreKeywordsResponse)
 async def get_ignore_keywords():
     """무시할 키워드 목록 조회"""
-    from pathlib import Path
-    import json
-    
-    settings_file = Path(__file__).parent.parent.parent / "data" / "settings.json"
     default_keywords = ["test", "monitor", "debug", "temp"]
     
-    if not settings_file.exists():
-        return {"keywords": default_keywords}
-    
     try:
-        data = json.loads(settings_file.read_text(encoding="utf-8"))
-        keywords = data.get("ignore_keywords", default_keywords)
+        keywords = read_persisted_settings().get("ignore_keywords", default_keywords)
         if isinstance(keywords, list):
             return {"keywords": [str(kw) for kw in keywords if kw]}
         return {"keywords": default_keywords}
@@ -290,35 +286,16 @@ async def get_ignore_keywords():
 @router.put("/ignore-keywords", response_model=IgnoreKeywordsResponse)
 async def update_ignore_keywords(data: IgnoreKeywordsUpdate):
     """무시할 키워드 목록 수정"""
-    from pathlib import Path
-    import json
-    
-    settings_file = Path(__file__).parent.parent.parent / "data" / "settings.json"
-    
-    # 기존 설정 로드
-    existing_data = {}
-    if settings_file.exists():
-        try:
-            existing_data = json.loads(settings_file.read_text(encoding="utf-8"))
-        except Exception:
-            pass
-    
-    # 키워드 업데이트
-    existing_data["ignore_keywords"] = [str(kw).strip() for kw in data.keywords if kw and kw.strip()]
-    
-    # 파일 저장
-    settings_file.parent.mkdir(parents=True, exist_ok=True)
-    settings_file.write_text(
-        json.dumps(existing_data, ensure_ascii=False, indent=2),
-        encoding="utf-8"
-    )
+    # 키워드만 갱신하여 저장 (기존 설정 유지)
+    ignore_keywords = [str(kw).strip() for kw in data.keywords if kw and kw.strip()]
+    update_persisted_values({"ignore_keywords": ignore_keywords})
     
     # SlackListener에 키워드 갱신 알림 (선택사항)
     system = await wait_for_system_instance(timeout=2)
     if system and system.slack_listener:
         system.slack_listener.ignore_keywords = [kw.lower() for kw in data.keywords if kw]
 
-    return {"keywords": existing_data["ignore_keywords"]}
+    return {"keywords": ignore_keywords}
 
 
 @router.post("/sync-google-sheets")
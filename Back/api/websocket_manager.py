@@ -62,13 +62,16 @@ class ConnectionManager:
             self.disconnect(websocket)
     
     async def broadcast_to_dashboard(self, message: dict):
-        """대시보드 구독자들에게 브로드캐스트"""
+        """대시보드 구독자들에게 브로드캐스트 (메시지는 한 번만 직렬화해 모든 클라이언트에 재사용)"""
         if not self.dashboard_subscribers:
             return
         
+        # send_json과 동일한 형식으로 직렬화
+        text = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+        
         async def send_to_client(websocket: WebSocket):
             try:
-                await websocket.send_json(message)
+                await websocket.send_text(text)
             except Exception:
                 self.disconnect(websocket)
         
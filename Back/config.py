@@ -37,6 +37,8 @@ class Config(BaseSettings):
     SCREEN_MONITOR_ENABLED: bool = False
     SCREEN_CHECK_INTERVAL: int = 1800
     FACE_DETECTION_THRESHOLD: int = 3
+    SCREEN_CAPTURE_REGION: Optional[str] = None
+    FACE_DETECTION_MODEL_PATH: Optional[str] = None
 
     GOOGLE_SHEETS_URL: Optional[str] = None
     CAMP_NAME: Optional[str] = None
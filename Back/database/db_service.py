@@ -23,6 +23,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# ZEP 이름 부분 분리 / 한글 포함 여부 검사 패턴
+_NAME_PARTS_PATTERN = re.compile(r'[/_\-|\s.()@{}\[\]]+')
+_HANGUL_PATTERN = re.compile(r'[\uAC00-\uD7A3]')
+
 # 서울 타임존 (한국 시간)
 try:
     from zoneinfo import ZoneInfo
@@ -154,9 +158,9 @@ class DBService:
             # 예: "IH_02_김영철" -> "김영철" 추출 -> "김영철/IH02"와 매칭
             # 한글 이름 부분 추출
             korean_parts = []
-            parts = re.split(r'[/_\-|\s.()@{}\[\]]+', zep_name.strip())
+            parts = _NAME_PARTS_PATTERN.split(zep_name.strip())
             for part in parts:
-                if any('\uAC00' <= char <= '\uD7A3' for char in part):
+                if _HANGUL_PATTERN.search(part):
                     korean_parts.append(part.strip())
 
             if korean_parts:
@@ -205,6 +209,41 @@ class DBService:
 
             return None
     
+    @staticmethod
+    async def get_student_by_any_zep_name(zep_names: List[str]) -> Optional[Student]:
+        """
+        여러 후보 ZEP 이름으로 학생 조회 (후보 순서가 우선순위)
+
+        후보 전체를 한 번의 쿼리로 정확 일치 조회하고,
+        정확 일치가 없을 때만 후보별 부분 일치/유사도 매칭을 시도합니다.
+
+        Args:
+            zep_names: 우선순위 순서의 후보 ZEP 이름 목록
+
+        Returns:
+            Student 객체 또는 None
+        """
+        candidates = list(dict.fromkeys(name for name in zep_names if name))
+        if not candidates:
+            return None
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(Student).where(Student.zep_name.in_(candidates))
+            )
+            students_by_name = {student.zep_name: student for student in result.scalars().all()}
+
+        for name in candidates:
+            student = students_by_name.get(name)
+            if student:
+                return student
+
+        for name in candidates:
+            student = await DBService.get_student_by_zep_name(name)
+            if student:
+                return student
+        return None
+
     @staticmethod
     async def get_student_by_discord_id(discord_id: int) -> Optional[Student]:
         """
@@ -240,7 +279,91 @@ class DBService:
             return result.scalar_one_or_none()
     
     @staticmethod
-    async def update_camera_status(zep_name: str, is_cam_on: bool, status_change_time: Optional[datetime] = None, is_restoring: bool = False) -> bool:
+    def camera_status_values(is_cam_on: bool, status_change_time: Optional[datetime] = None) -> dict:
+        """
+        카메라 상태 변경 시 갱신할 컬럼 값
+
+        Args:
+            is_cam_on: 카메라 ON/OFF 상태
+            status_change_time: 상태 변경 시간 (None이면 last_status_change 유지)
+
+        Returns:
+            컬럼명 -> 값 딕셔너리
+        """
+        values = {"is_cam_on": is_cam_on}
+
+        # status_change_time이 명시적으로 전달된 경우에만 last_status_change 업데이트
+        if status_change_time is not None:
+            if status_change_time.tzinfo is None:
+                status_change_time = status_change_time.replace(tzinfo=timezone.utc)
+            values["last_status_change"] = to_naive(status_change_time)
+
+        if is_cam_on:
+            values["last_alert_sent"] = None
+            values["response_status"] = None
+            values["response_time"] = None
+            values["alert_count"] = 0
+            # 카메라가 ON이면 접속 종료 상태도 초기화 (재입장한 경우)
+            values["last_leave_time"] = None
+        return values
+
+    @staticmethod
+    def absent_clear_values() -> dict:
+        """
+        외출/조퇴 상태 초기화 시 갱신할 컬럼 값
+
+        Returns:
+            컬럼명 -> 값 딕셔너리
+        """
+        return {
+            "is_absent": False,
+            "absent_type": None,
+            "last_leave_time": None,
+            "last_absent_alert": None,
+            "last_leave_admin_alert": None,
+            "last_return_request_time": None,
+        }
+
+    @staticmethod
+    def user_leave_values() -> dict:
+        """
+        접속 종료 시 갱신할 컬럼 값
+
+        Returns:
+            컬럼명 -> 값 딕셔너리
+        """
+        return {"last_leave_time": to_naive(utcnow())}
+
+    @staticmethod
+    async def apply_student_updates(updates: dict[int, dict]):
+        """
+        학생별 컬럼 값을 한 트랜잭션으로 일괄 반영
+
+        Args:
+            updates: 학생 ID -> (컬럼명 -> 값) 딕셔너리
+        """
+        if not updates:
+            return
+
+        now = to_naive(utcnow())
+        async with AsyncSessionLocal() as session:
+            for student_id, values in updates.items():
+                await session.execute(
+                    update(Student)
+                    .where(Student.id == student_id)
+                    .values(**values, updated_at=now)
+                )
+            await session.commit()
+
+    @staticmethod
+    async def update_camera_status(
+        zep_name: str,
+        is_cam_on: bool,
+        status_change_time: Optional[datetime] = None,
+        is_restoring: bool = False,
+        clear_absent: bool = False,
+        record_leave: bool = False
+    ) -> bool:
         """
         카메라 상태 업데이트
 
@@ -249,57 +372,48 @@ class DBService:
             is_cam_on: 카메라 ON/OFF 상태
             status_change_time: 상태 변경 시간 (None이면 현재 시간 사용, 히스토리 복원 시 메시지 타임스탬프 사용)
             is_restoring: 히스토리 복원 중 여부 (True면 status_type을 초기화하지 않음)
+            clear_absent: 외출/조퇴 상태도 같은 UPDATE로 초기화 (clear_absent_status와 동일)
+            record_leave: 접속 종료 시간도 같은 UPDATE로 기록 (record_user_leave와 동일)
 
         Returns:
             업데이트 성공 여부
         """
         async with AsyncSessionLocal() as session:
-            update_values = {
-                "is_cam_on": is_cam_on,
-                "updated_at": to_naive(utcnow())
-            }
-
-            # status_change_time이 명시적으로 전달된 경우에만 last_status_change 업데이트
-            if status_change_time is not None:
-                if status_change_time.tzinfo is None:
-                    status_change_time = status_change_time.replace(tzinfo=timezone.utc)
-                update_values["last_status_change"] = to_naive(status_change_time)
-            
-            if is_cam_on:
-                update_values["last_alert_sent"] = None
-                update_values["response_status"] = None
-                update_values["response_time"] = None
-                update_values["alert_count"] = 0
-                # 카메라가 ON이면 접속 종료 상태도 초기화 (재입장한 경우)
-                update_values["last_leave_time"] = None
-
-                # 히스토리 복원 중이 아닐 때만 상태를 초기화
-                if not is_restoring:
-                    # 지각/외출/조퇴 상태인 경우 카메라 ON 시 정상으로 복귀
-                    # (휴가, 결석은 하루 종일 유효하므로 유지)
-                    # 먼저 현재 상태를 확인해야 하므로, 별도 쿼리로 처리
-                    result = await session.execute(
-                        select(Student.status_type, Student.status_protected).where(Student.zep_name == zep_name)
+            update_values = {}
+            if clear_absent:
+                update_values.update(DBService.absent_clear_values())
+            if record_leave:
+                update_values.update(DBService.user_leave_values())
+            update_values.update(DBService.camera_status_values(is_cam_on, status_change_time))
+            update_values["updated_at"] = to_naive(utcnow())
+
+            # 카메라 ON 시 히스토리 복원 중이 아닐 때만 상태를 초기화
+            if is_cam_on and not is_restoring:
+                # 지각/외출/조퇴 상태인 경우 카메라 ON 시 정상으로 복귀
+                # (휴가, 결석은 하루 종일 유효하므로 유지)
+                # 먼저 현재 상태를 확인해야 하므로, 별도 쿼리로 처리
+                result = await session.execute(
+                    select(Student.status_type, Student.status_protected).where(Student.zep_name == zep_name)
+                )
+                row = result.first()
+                if row:
+                    current_status, is_protected = row
+                    # Google Sheets에서 설정한 보호된 상태가 아닌 경우에만 초기화
+                    # is_protected가 None이면 False로 간주 (보호되지 않음)
+                    protected = is_protected if is_protected is not None else False
+
+                    logger.info(
+                        f"[카메라 ON 상태 체크] {zep_name}: "
+                        f"status={current_status}, protected={protected}, "
+                        f"초기화 대상={not protected and current_status in ['late', 'leave', 'early_leave']}"
                     )
-                    row = result.first()
-                    if row:
-                        current_status, is_protected = row
-                        # Google Sheets에서 설정한 보호된 상태가 아닌 경우에만 초기화
-                        # is_protected가 None이면 False로 간주 (보호되지 않음)
-                        protected = is_protected if is_protected is not None else False
-
-                        logger.info(
-                            f"[카메라 ON 상태 체크] {zep_name}: "
-                            f"status={current_status}, protected={protected}, "
-                            f"초기화 대상={not protected and current_status in ['late', 'leave', 'early_leave']}"
-                        )
 
-                        if not protected and current_status in ["late", "leave", "early_leave"]:
-                            # 지각/외출/조퇴 상태를 정상으로 변경 (카메라 ON = 복귀)
-                            update_values["status_type"] = None
-                            update_values["status_set_at"] = None
-                            update_values["alarm_blocked_until"] = None
-                            logger.info(f"[상태 초기화] {zep_name}: {current_status} → 정상")
+                    if not protected and current_status in ["late", "leave", "early_leave"]:
+                        # 지각/외출/조퇴 상태를 정상으로 변경 (카메라 ON = 복귀)
+                        update_values["status_type"] = None
+                        update_values["status_set_at"] = None
+                        update_values["alarm_blocked_until"] = None
+                        logger.info(f"[상태 초기화] {zep_name}: {current_status} → 정상")
             
             result = await session.execute(
                 update(Student)
@@ -858,7 +972,7 @@ class DBService:
                 update(Student)
                 .where(Student.id == student_id)
                 .values(
-                    last_leave_time=to_naive(utcnow()),
+                    **DBService.user_leave_values(),
                     updated_at=to_naive(utcnow())
                 )
             )
@@ -958,12 +1072,7 @@ class DBService:
                 update(Student)
                 .where(Student.id == student_id)
                 .values(
-                    is_absent=False,
-                    absent_type=None,
-                    last_leave_time=None,
-                    last_absent_alert=None,
-                    last_leave_admin_alert=None,
-                    last_return_request_time=None,
+                    **DBService.absent_clear_values(),
                     updated_at=to_naive(utcnow())
                 )
             )
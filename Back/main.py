@@ -3,6 +3,9 @@ ZEP 학생 모니터링 시스템 (Slack Socket Mode)
 메인 엔트리 포인트 - 모든 서비스를 통합하여 실행
 """
 import asyncio
+import logging
+import logging.handlers
+import queue
 import signal
 import sys
 from datetime import datetime, timezone, date
@@ -20,6 +23,29 @@ from api.websocket_manager import manager
 
 _system_instance: Optional['ZepMonitoringSystem'] = None
 
+
+def setup_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    루트 로거를 큐 기반으로 설정 (이벤트 루프가 stdout 쓰기를 기다리지 않도록)
+
+    Args:
+        level: 루트 로거 레벨
+
+    Returns:
+        시작된 QueueListener (종료 시 stop() 호출)
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
 def get_system_instance() -> Optional['ZepMonitoringSystem']:
     """전역 시스템 인스턴스 반환"""
     return _system_instance
@@ -794,6 +820,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    log_listener = setup_logging()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -801,4 +828,6 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"\n❌ 프로그램 오류: {e}")
         sys.exit(1)
+    finally:
+        log_listener.stop()
 
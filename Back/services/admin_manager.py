@@ -1,7 +1,7 @@
 """
 관리자 권한 캐시 관리
 """
-from typing import Set
+from typing import FrozenSet
 import asyncio
 
 from database import DBService
@@ -9,7 +9,7 @@ from database import DBService
 
 class AdminManager:
     def __init__(self):
-        self._admin_ids: Set[int] = set()
+        self._admin_ids: FrozenSet[int] = frozenset()
         self._loaded = False
         self._lock = asyncio.Lock()
 
@@ -17,7 +17,7 @@ class AdminManager:
         """DB에서 관리자 목록을 다시 불러옴"""
         async with self._lock:
             ids = await DBService.get_admin_ids()
-            self._admin_ids = {admin_id for admin_id in ids if admin_id is not None}
+            self._admin_ids = frozenset(admin_id for admin_id in ids if admin_id is not None)
             self._loaded = True
 
     async def ensure_loaded(self):
@@ -34,6 +34,10 @@ class AdminManager:
     def get_ids(self):
         return list(self._admin_ids)
 
+    def get_id_set(self) -> FrozenSet[int]:
+        """관리자 ID 집합 (refresh 시 통째로 교체되므로 그대로 보관해도 안전)"""
+        return self._admin_ids
+
 
 admin_manager = AdminManager()
 
@@ -53,6 +53,15 @@ class DiscordBot(commands.Bot):
             관리자 여부
         """
         return admin_manager.is_admin(user_id)
+
+    @property
+    def admin_id_set(self) -> frozenset:
+        """
+        관리자 Discord ID 집합 (루프에서 한 번만 가져와 멤버십 검사용)
+
+        비어 있으면 is_admin()과 마찬가지로 모든 사용자를 관리자로 취급해야 합니다.
+        """
+        return admin_manager.get_id_set()
     
     def _is_student_pattern(self, name: str) -> bool:
         """
@@ -5,7 +5,8 @@
 import asyncio
 import logging
 from datetime import datetime, time, timezone, date
-from typing import Optional
+from enum import IntEnum
+from typing import Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from config import config
@@ -18,6 +19,13 @@ from utils.dashboard_utils import build_overview
 logger = logging.getLogger(__name__)
 
 
+class _ClassState(IntEnum):
+    """수업 시작/종료 이벤트 감지 상태"""
+    UNKNOWN = 0
+    IN_CLASS = 1
+    AFTER_CLASS = 2
+
+
 class MonitorService:
     """모니터링 서비스 클래스"""
     
@@ -41,15 +49,17 @@ class MonitorService:
         self.return_reminder_time = config.RETURN_REMINDER_TIME
         self.start_time = None
         self.warmup_minutes = 1
-        self.last_lunch_check = None
-        self.last_class_check = None  # 수업 시작/종료 감지용
+        self.last_class_check = _ClassState.UNKNOWN  # 수업 시작/종료 감지용
         self.daily_reset_time = self._parse_daily_reset_time(config.DAILY_RESET_TIME)
-        self.last_daily_reset_date: Optional[str] = None
+        self._schedule_seconds = self._build_schedule_seconds()
+        self.last_daily_reset_ordinal: Optional[int] = None  # 마지막 일일 초기화 날짜 (date.toordinal)
         self.reset_time: Optional[datetime] = None
         self.is_resetting = False
         self.is_dm_paused = False
         self.is_monitoring_paused = False
         self.holiday_checker = HolidayChecker()
+        self._dashboard_broadcast: Optional[asyncio.Future] = None  # 진행 중인 대시보드 브로드캐스트
+        self._dashboard_dirty = False
     
     def set_slack_listener(self, slack_listener):
         """SlackListener 참조 설정 (순환 참조 방지)"""
@@ -94,9 +104,7 @@ class MonitorService:
             try:
                 await self._check_students()
             except Exception as e:
-                print(f"❌ [모니터링] 체크 중 오류 발생: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.error(f"❌ [모니터링] 체크 중 오류 발생: {e}", exc_info=True)
             finally:
                 await asyncio.sleep(self.check_interval)
         
@@ -154,6 +162,10 @@ class MonitorService:
             self.daily_reset_time = self._parse_daily_reset_time(kwargs['daily_reset_time'])
             print(f"⚙️ 일일 초기화 시간 변경: {kwargs['daily_reset_time']}")
 
+        if any(key in kwargs for key in ('class_start_time', 'class_end_time', 'lunch_start_time', 'lunch_end_time')):
+            self._schedule_seconds = self._build_schedule_seconds()
+            print(f"⚙️ 수업 시간 변경: {config.CLASS_START_TIME} ~ {config.CLASS_END_TIME} (점심 {config.LUNCH_START_TIME} ~ {config.LUNCH_END_TIME})")
+
     def is_monitoring_active(self) -> bool:
         """
         모니터링이 활성화되어 있는지 확인
@@ -170,6 +182,27 @@ class MonitorService:
         
         return True
     
+    def _build_schedule_seconds(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        수업/점심 시간 설정을 자정 기준 초 단위 정수로 미리 변환
+
+        Returns:
+            (수업 시작, 수업 종료, 점심 시작, 점심 종료) 또는 형식 오류 시 None
+        """
+        try:
+            times = [
+                datetime.strptime(value, "%H:%M").time()
+                for value in (
+                    config.CLASS_START_TIME,
+                    config.CLASS_END_TIME,
+                    config.LUNCH_START_TIME,
+                    config.LUNCH_END_TIME,
+                )
+            ]
+        except (TypeError, ValueError):
+            return None
+        return tuple(t.hour * 3600 + t.minute * 60 for t in times)
+
     def _is_class_time(self) -> bool:
         """
         현재 시간이 수업 시간인지 확인
@@ -177,28 +210,16 @@ class MonitorService:
         Returns:
             bool: 수업 시간이면 True, 아니면 False
         """
-        now = now_seoul()  # 서울 시간 사용
-        current_time = now.time()
-
-        try:
-            class_start = datetime.strptime(config.CLASS_START_TIME, "%H:%M").time()
-            class_end = datetime.strptime(config.CLASS_END_TIME, "%H:%M").time()
-            lunch_start = datetime.strptime(config.LUNCH_START_TIME, "%H:%M").time()
-            lunch_end = datetime.strptime(config.LUNCH_END_TIME, "%H:%M").time()
-        except ValueError:
-            return False
-
-        if current_time < class_start:
+        schedule = self._schedule_seconds
+        if schedule is None:
             return False
 
-        if current_time > class_end:
-            return False
+        now = now_seoul()  # 서울 시간 사용
+        seconds = now.hour * 3600 + now.minute * 60 + now.second
+        class_start, class_end, lunch_start, lunch_end = schedule
 
         # 점심시간: 시작 포함, 종료 미포함으로 통일
-        if lunch_start <= current_time < lunch_end:
-            return False
-
-        return True
+        return class_start <= seconds <= class_end and not (lunch_start <= seconds < lunch_end)
     
     async def _check_schedule_events(self, now: datetime):
         """수업/점심 시간 이벤트 체크 (모니터링 활성화 여부와 무관하게 실행)"""
@@ -211,7 +232,7 @@ class MonitorService:
             class_end = datetime.strptime(config.CLASS_END_TIME, "%H:%M").time()
             
             # 수업 시작 감지
-            if current_time_obj >= class_start and self.last_class_check != "in_class":
+            if current_time_obj >= class_start and self.last_class_check != _ClassState.IN_CLASS:
                 if current_time_obj < class_end:
                     await manager.broadcast_system_log(
                         level="info",
@@ -219,17 +240,17 @@ class MonitorService:
                         event_type="class_start",
                         message=f"수업이 시작되었습니다. ({current_time})"
                     )
-                    self.last_class_check = "in_class"
+                    self.last_class_check = _ClassState.IN_CLASS
             
             # 수업 종료 감지
-            if current_time_obj > class_end and self.last_class_check == "in_class":
+            if current_time_obj > class_end and self.last_class_check == _ClassState.IN_CLASS:
                 await manager.broadcast_system_log(
                     level="info",
                     source="system",
                     event_type="class_end",
                     message=f"수업이 종료되었습니다. ({current_time})"
                 )
-                self.last_class_check = "after_class"
+                self.last_class_check = _ClassState.AFTER_CLASS
         except ValueError:
             pass
 
@@ -270,7 +291,6 @@ class MonitorService:
         """학생들의 카메라 상태 체크"""
         now_utc = datetime.now(timezone.utc)
         now_local = now_seoul()
-        current_time_obj = now_local.time()
 
         await self._check_daily_reset(now_local)
         await self._check_scheduled_status()
@@ -292,28 +312,24 @@ class MonitorService:
             if elapsed < self.warmup_minutes:
                 return
 
-        # 수업 시간 체크
+        # 수업 시간 체크 (점심 시간 포함)
         is_class_time = self._is_class_time()
         if not is_class_time:
             return
 
-        # 점심 시간인지 확인 (시간 객체로 비교)
-        try:
-            lunch_start = datetime.strptime(config.LUNCH_START_TIME, "%H:%M").time()
-            lunch_end = datetime.strptime(config.LUNCH_END_TIME, "%H:%M").time()
-            is_lunch_time = lunch_start <= current_time_obj < lunch_end
-            if is_lunch_time:
-                return
-        except ValueError:
-            pass
-
         joined_today = self.slack_listener.get_joined_students_today() if self.slack_listener else set()
 
         await self._check_not_joined_students(joined_today)
         
-        await self._check_left_students()
+        admin_ids = self.discord_bot.admin_id_set
+
+        await self._check_left_students(now_utc, joined_today, admin_ids)
         
-        await self._check_return_requests()
+        await self._check_return_requests(admin_ids)
+
+        # DM 발송 일시정지 중에는 알림 대상 조회/쿨다운 확인(DB 조회)을 생략
+        if self.is_dm_paused:
+            return
 
         students = await self.db_service.get_students_camera_off_too_long(
             self.camera_off_threshold,
@@ -327,14 +343,11 @@ class MonitorService:
 
         # 수업 시작 시간 계산 (수업 시작 전 입장한 학생은 수업 시작 시간부터 카운트)
         class_start_time_utc = None
-        try:
-            class_start = datetime.strptime(config.CLASS_START_TIME, "%H:%M").time()
-            today_seoul = now_seoul().date()
-            class_start_dt = datetime.combine(today_seoul, class_start)
-            class_start_dt_seoul = class_start_dt.replace(tzinfo=SEOUL_TZ)
+        if self._schedule_seconds is not None:
+            class_start_seconds = self._schedule_seconds[0]
+            class_start = time(class_start_seconds // 3600, class_start_seconds % 3600 // 60)
+            class_start_dt_seoul = datetime.combine(now_local.date(), class_start, tzinfo=SEOUL_TZ)
             class_start_time_utc = class_start_dt_seoul.astimezone(timezone.utc)
-        except:
-            pass
 
         for student in students:
             if not student.discord_id:
@@ -357,11 +370,6 @@ class MonitorService:
             if student.is_absent:
                 continue
 
-            # 알람 차단 상태 확인
-            is_blocked = await self.db_service.is_alarm_blocked(student.id)
-            if is_blocked:
-                continue
-
             # 수업 시작 전에 입장한 학생은 수업 시작 시간부터 카운트
             if class_start_time_utc and student.last_status_change:
                 last_change_utc = student.last_status_change if student.last_status_change.tzinfo else student.last_status_change.replace(tzinfo=timezone.utc)
@@ -373,6 +381,11 @@ class MonitorService:
                     if elapsed_from_class_start < self.camera_off_threshold:
                         continue
 
+            # 알람 차단 상태 확인 (DB 조회이므로 다른 조건을 모두 통과한 학생만)
+            is_blocked = await self.db_service.is_alarm_blocked(student.id)
+            if is_blocked:
+                continue
+
             candidate_students.append(student)
 
         if not candidate_students:
@@ -387,10 +400,6 @@ class MonitorService:
             return
         
         for student in students_to_alert:
-
-            if self.is_dm_paused:
-                continue
-
             if not student.last_status_change:
                 continue
 
@@ -446,8 +455,19 @@ class MonitorService:
                     student_id=student.id
                 )
         
-    async def _check_left_students(self):
-        """접속 종료 후 복귀하지 않은 학생들 체크"""
+    async def _check_left_students(self, now_utc: datetime, joined_today: set[int], admin_ids: frozenset):
+        """
+        접속 종료 후 복귀하지 않은 학생들 체크
+
+        Args:
+            now_utc: 현재 시각 (UTC)
+            joined_today: 오늘 접속한 학생 ID 집합
+            admin_ids: 관리자 Discord ID 집합 (비어 있으면 모두 관리자로 취급)
+        """
+        # 모든 알림이 DM이므로 일시정지 중에는 DB 조회 자체를 생략
+        if self.is_dm_paused:
+            return
+
         students = await self.db_service.get_students_left_too_long(
             self.leave_alert_threshold
         )
@@ -455,21 +475,16 @@ class MonitorService:
         if not students:
             return
         
-        joined_today = self.slack_listener.get_joined_students_today() if self.slack_listener else set()
-        
         non_absent_candidates = []
         absent_candidates = []
 
         for student in students:
-            if student.discord_id and self.discord_bot.is_admin(student.discord_id):
+            if student.discord_id and (not admin_ids or student.discord_id in admin_ids):
                 continue
 
             if student.id not in joined_today:
                 continue
 
-            if self.is_dm_paused:
-                continue
-
             # status_type이 있으면 (지각, 외출, 조퇴, 휴가, 결석, 미접속) 알림 보내지 않음
             if student.status_type in ['late', 'leave', 'early_leave', 'vacation', 'absence', 'not_joined']:
                 continue
@@ -553,8 +568,16 @@ class MonitorService:
                         student_id=student.id
                     )
     
-    async def _check_return_requests(self):
-        """복귀 요청 후 접속하지 않은 학생들 체크"""
+    async def _check_return_requests(self, admin_ids: frozenset):
+        """
+        복귀 요청 후 접속하지 않은 학생들 체크
+
+        Args:
+            admin_ids: 관리자 Discord ID 집합 (비어 있으면 모두 관리자로 취급)
+        """
+        if self.is_dm_paused:
+            return
+
         students = await self.db_service.get_students_with_return_request(
             self.return_reminder_time
         )
@@ -566,10 +589,7 @@ class MonitorService:
             if not student.discord_id:
                 continue
 
-            if self.discord_bot.is_admin(student.discord_id):
-                continue
-
-            if self.is_dm_paused:
+            if not admin_ids or student.discord_id in admin_ids:
                 continue
 
             # status_type이 있으면 (지각, 외출, 조퇴, 휴가, 결석, 미접속) 알림 보내지 않음
@@ -607,7 +627,7 @@ class MonitorService:
         
         from database.db_service import SEOUL_TZ
         now_local = now_seoul()
-        today_str = now_local.strftime("%Y-%m-%d")
+        today_ordinal = now_local.toordinal()
         scheduled_dt = datetime.combine(now_local.date(), self.daily_reset_time)
         # 서울 시간으로 설정 후 UTC로 변환
         scheduled_dt_seoul = scheduled_dt.replace(tzinfo=SEOUL_TZ)
@@ -631,7 +651,7 @@ class MonitorService:
             
             if has_recent_students:
                 self.reset_time = scheduled_dt_utc
-                self.last_daily_reset_date = today_str
+                self.last_daily_reset_ordinal = today_ordinal
                 print(f"💾 오늘 초기화는 이미 실행되었습니다 ({scheduled_dt.strftime('%Y-%m-%d %H:%M')})")
                 print("   ✅ 초기화 시간 이후 접속한 학생의 상태가 보존됩니다.")
             else:
@@ -645,7 +665,7 @@ class MonitorService:
                 
                 reset_time = await self.db_service.reset_alert_status_preserving_recent(scheduled_dt_utc)
                 self.reset_time = reset_time
-                self.last_daily_reset_date = today_str
+                self.last_daily_reset_ordinal = today_ordinal
                 
                 self.is_resetting = False
                 await manager.broadcast_system_log(
@@ -678,8 +698,8 @@ class MonitorService:
         if not self.daily_reset_time:
             return
         
-        today_str = now.strftime("%Y-%m-%d")
-        if self.last_daily_reset_date == today_str:
+        today_ordinal = now.toordinal()
+        if self.last_daily_reset_ordinal == today_ordinal:
             return
         
         from database.db_service import SEOUL_TZ
@@ -698,7 +718,7 @@ class MonitorService:
             )
             reset_time = await self.db_service.reset_all_alert_status()
             self.reset_time = reset_time
-            self.last_daily_reset_date = today_str
+            self.last_daily_reset_ordinal = today_ordinal
 
             # 날짜 기반 상태 자동 해제 (휴가/결석 등)
             await self.db_service.check_and_reset_status_by_date()
@@ -728,12 +748,31 @@ class MonitorService:
         return build_overview(students, joined_today, now, self.camera_off_threshold)
     
     async def broadcast_dashboard_update_now(self):
-        """대시보드 업데이트 즉시 브로드캐스트 (상태 변경 시 호출)"""
+        """
+        대시보드 업데이트 즉시 브로드캐스트 (상태 변경 시 호출)
+
+        이미 브로드캐스트가 진행 중이면 새로 계산하지 않고 합류하며,
+        그 사이 들어온 요청은 진행 중인 작업이 끝난 뒤 한 번만 다시 반영합니다.
+        """
+        if self._dashboard_broadcast is not None:
+            self._dashboard_dirty = True
+            await asyncio.shield(self._dashboard_broadcast)
+            return
+
+        self._dashboard_broadcast = asyncio.get_running_loop().create_future()
         try:
-            overview = await self._get_dashboard_overview()
-            await manager.broadcast_dashboard_update(overview)
-        except Exception:
-            pass
+            while True:
+                self._dashboard_dirty = False
+                try:
+                    overview = await self._get_dashboard_overview()
+                    await manager.broadcast_dashboard_update(overview)
+                except Exception:
+                    pass
+                if not self._dashboard_dirty:
+                    break
+        finally:
+            broadcast, self._dashboard_broadcast = self._dashboard_broadcast, None
+            broadcast.set_result(None)
     
     async def _broadcast_dashboard_periodically(self):
         """1초마다 대시보드 현황 브로드캐스트 (상태 변경 시 즉시 업데이트되므로 백업용)"""
@@ -7,20 +7,42 @@ import numpy as np
 import mss
 import pytesseract
 import asyncio
+import hashlib
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set
 from difflib import get_close_matches
 
 try:
-    from Levenshtein import distance as levenshtein_distance
-    LEVENSHTEIN_AVAILABLE = True
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
 except ImportError:
-    LEVENSHTEIN_AVAILABLE = False
-    print("⚠️ python-Levenshtein이 설치되지 않았습니다. 이름 매칭 정확도가 낮아질 수 있습니다.")
+    RAPIDFUZZ_AVAILABLE = False
+    print("⚠️ rapidfuzz가 설치되지 않았습니다. 이름 유사도 매칭이 느려질 수 있습니다.")
+
+try:
+    import tesserocr
+    from PIL import Image
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Windows에서는 DXGI Desktop Duplication 기반 캡처 사용 (없으면 mss)
+try:
+    import bettercam
+    BETTERCAM_AVAILABLE = sys.platform == "win32"
+except ImportError:
+    BETTERCAM_AVAILABLE = False
 
 from config import config
 from database import DBService
 
+# 이름 비교 시 제거할 문자 (공백/특수문자/밑줄) - 한글 음절은 isalnum()이므로 유지됨
+_NON_NAME_CHARS = re.compile(r"[\W_]+")
+
 
 class ScreenMonitor:
     """화면 모니터링 클래스"""
@@ -36,22 +58,53 @@ class ScreenMonitor:
         self.db_service = DBService()
         self.is_running = False
         
-        # 얼굴 감지 모델 초기화
-        try:
-            self.face_cascade = cv2.CascadeClassifier(
-                cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-            )
-            if self.face_cascade.empty():
-                raise Exception("얼굴 감지 모델을 로드할 수 없습니다.")
-        except Exception as e:
-            print(f"❌ 얼굴 감지 모델 초기화 실패: {e}")
-            self.face_cascade = None
+        # 얼굴 감지 모델 초기화 (YuNet DNN 모델이 있으면 우선 사용)
+        self.face_detector = None
+        self.face_cascade = None
+        if config.FACE_DETECTION_MODEL_PATH:
+            try:
+                self.face_detector = cv2.FaceDetectorYN.create(
+                    config.FACE_DETECTION_MODEL_PATH,
+                    "",
+                    (320, 320),
+                    score_threshold=0.8
+                )
+                print("   • 얼굴 감지 모델: YuNet (DNN)")
+            except Exception as e:
+                print(f"⚠️ YuNet 얼굴 감지 모델 로드 실패, Haar cascade를 사용합니다: {e}")
+                self.face_detector = None
+        
+        if self.face_detector is None:
+            try:
+                self.face_cascade = cv2.CascadeClassifier(
+                    cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+                )
+                if self.face_cascade.empty():
+                    raise Exception("얼굴 감지 모델을 로드할 수 없습니다.")
+            except Exception as e:
+                print(f"❌ 얼굴 감지 모델 초기화 실패: {e}")
+                self.face_cascade = None
         
         # 설정
         self.check_interval = config.SCREEN_CHECK_INTERVAL
         self.threshold = config.FACE_DETECTION_THRESHOLD
+        self.capture_region = self._parse_capture_region(config.SCREEN_CAPTURE_REGION)
+        self.ocr_config = r'--oem 3 --psm 6'  # 단일 텍스트 블록
+        self.tess_api = None  # 상주 Tesseract 엔진 (tesserocr 설치 시)
+        self._ocr_lock = threading.Lock()
+        # 직전 프레임과 화면이 같으면 OCR을 다시 돌리지 않도록 결과 캐시
+        self._last_ocr_hash: Optional[bytes] = None
+        self._last_ocr_text = ""
+        # 매 체크마다 다시 만들지 않도록 OpenCV 객체/버퍼 재사용 (작업 스레드 1개에서만 사용)
+        self._clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        self._gray_buf: Optional[np.ndarray] = None
+        self._camera = None  # bettercam 캡처 장치 (Windows)
+        # 캡처/OpenCV/OCR은 블로킹 작업이므로 이벤트 루프 밖에서 실행
+        self._cv_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screen-monitor")
         self.start_time = None  # 서비스 시작 시간
         self.warmup_minutes = 1  # 워밍업 시간 (분)
+        self.missing_ticks_required = 2  # 연속으로 미감지되어야 부재로 판단하는 체크 횟수
+        self._missing_streak: Dict[str, int] = {}  # 학생별 연속 미감지 횟수
         
         print("✅ 화면 모니터링 서비스 초기화 완료")
     
@@ -61,16 +114,21 @@ class ScreenMonitor:
             print("ℹ️ 화면 모니터링이 비활성화되어 있습니다. (.env에서 SCREEN_MONITOR_ENABLED=true로 설정)")
             return
         
-        if not self.face_cascade:
+        if self.face_detector is None and not self.face_cascade:
             print("❌ 얼굴 감지 모델이 초기화되지 않아 화면 모니터링을 시작할 수 없습니다.")
             return
         
         self.is_running = True
         self.start_time = datetime.now()  # 시작 시간 기록
+        self._init_ocr_engine()
+        self._init_capture_device()
         
         print(f"👁️ 화면 모니터링 시작 (체크 간격: {self.check_interval}초 / {self.check_interval//60}분)")
         print(f"   • 감지 차이 임계값: {self.threshold}명")
+        if self.capture_region:
+            print(f"   • 캡처 영역: {self.capture_region}")
         print(f"   • 워밍업 시간: {self.warmup_minutes}분 (시작 후 알림 안 보냄)")
+        print(f"   • 부재 판단: {self.missing_ticks_required}회 연속 미감지")
         
         while self.is_running:
             try:
@@ -83,8 +141,70 @@ class ScreenMonitor:
     async def stop(self):
         """모니터링 중지"""
         self.is_running = False
+        if self.tess_api:
+            with self._ocr_lock:
+                self.tess_api.End()
+                self.tess_api = None
+        if self._camera:
+            try:
+                self._camera.stop()
+            except Exception:
+                pass
+            self._camera = None
         print("🛑 화면 모니터링 중지")
     
+    def _init_capture_device(self):
+        """
+        Windows에서 bettercam(DXGI) 캡처 장치를 준비
+        
+        비디오 모드로 최신 프레임을 계속 유지하므로 캡처 시
+        GDI BitBlt 없이 마지막 프레임만 가져옵니다. 실패하면 mss를 사용합니다.
+        """
+        if not BETTERCAM_AVAILABLE or self._camera:
+            return
+        
+        try:
+            camera = bettercam.create(output_idx=0, output_color="GRAY")
+            region = None
+            if self.capture_region:
+                region = (
+                    self.capture_region["left"],
+                    self.capture_region["top"],
+                    self.capture_region["left"] + self.capture_region["width"],
+                    self.capture_region["top"] + self.capture_region["height"],
+                )
+            camera.start(region=region, target_fps=1, video_mode=True)
+            self._camera = camera
+            print("   • 화면 캡처: bettercam (DXGI)")
+        except Exception as e:
+            print(f"⚠️ bettercam 초기화 실패, mss를 사용합니다: {e}")
+            self._camera = None
+    
+    def _init_ocr_engine(self):
+        """
+        Tesseract 엔진을 한 번만 로드하고 워밍업
+        
+        tesserocr가 있으면 언어 모델을 프로세스 내에 상주시켜
+        매 체크마다 Tesseract 프로세스를 새로 띄우지 않습니다.
+        """
+        if not TESSEROCR_AVAILABLE or self.tess_api:
+            return
+        
+        try:
+            api = tesserocr.PyTessBaseAPI(
+                lang='kor+eng',
+                psm=tesserocr.PSM.SINGLE_BLOCK,
+                oem=tesserocr.OEM.DEFAULT
+            )
+            # 워밍업: 첫 인식 시 발생하는 초기화 비용을 미리 지불
+            api.SetImage(Image.new('L', (32, 32), 255))
+            api.GetUTF8Text()
+            self.tess_api = api
+            print("   • OCR 엔진: tesserocr (상주)")
+        except Exception as e:
+            print(f"⚠️ tesserocr 초기화 실패, pytesseract를 사용합니다: {e}")
+            self.tess_api = None
+    
     async def _check_screen(self):
         """화면 체크 실행"""
         # 워밍업 시간 체크 (프로그램 시작 직후 알림 방지)
@@ -96,8 +216,13 @@ class ScreenMonitor:
         
         current_time = datetime.now().strftime("%H:%M")
         
-        # 1. DB에서 카메라 ON 학생 조회
-        camera_on_students = await self.db_service.get_camera_on_students()
+        # 1. DB에서 카메라 ON 학생 조회 + 화면 캡처 (서로 독립적이므로 동시에 진행)
+        # 캡처는 Discord 봇 이벤트 루프를 막지 않도록 스레드에서 실행
+        loop = asyncio.get_running_loop()
+        camera_on_students, frame = await asyncio.gather(
+            self.db_service.get_camera_on_students(),
+            loop.run_in_executor(self._cv_executor, self.capture_screen)
+        )
         
         if not camera_on_students:
             print("   ℹ️ 카메라 ON 상태인 학생이 없습니다.")
@@ -108,28 +233,37 @@ class ScreenMonitor:
         print(f"   📊 카메라 ON 학생: {expected_count}명")
         print(f"   👥 {', '.join(student_names)}")
         
-        # 2. 화면 캡처 및 분석
+        # 2. 화면 분석
         try:
-            frame = self.capture_screen()
             if frame is None:
                 print("   ❌ 화면 캡처 실패")
                 return
             
-            # 3. 화면에서 이름 + 얼굴 감지
-            detected_names = self.detect_students_on_screen(frame, student_names)
+            # 3. 화면에서 이름 + 얼굴 감지 (스레드에서 실행)
+            detected_names = await loop.run_in_executor(
+                self._cv_executor,
+                self.detect_students_on_screen,
+                frame,
+                student_names
+            )
             detected_count = len(detected_names)
             
             print(f"   🎯 화면에서 감지: {detected_count}명")
             if detected_names:
                 print(f"   ✅ 감지된 학생: {', '.join(detected_names)}")
             
-            # 4. 차이 확인
-            missing_count = expected_count - detected_count
+            # 4. 차이 확인 (일시적인 OCR 누락으로 알림이 가지 않도록 연속 미감지만 부재로 판단)
+            self._missing_streak = {
+                name: 0 if name in detected_names else self._missing_streak.get(name, 0) + 1
+                for name in student_names
+            }
+            missing_students = [
+                name for name in student_names
+                if self._missing_streak[name] >= self.missing_ticks_required
+            ]
+            missing_count = len(missing_students)
             
             if missing_count >= self.threshold:
-                # 누가 없는지 파악
-                missing_students = [name for name in student_names if name not in detected_names]
-                
                 print(f"   ⚠️ {missing_count}명 부재 감지!")
                 print(f"   ❌ 미감지 학생: {', '.join(missing_students)}")
                 
@@ -147,26 +281,75 @@ class ScreenMonitor:
             import traceback
             traceback.print_exc()
     
+    def _parse_capture_region(self, region_str: Optional[str]) -> Optional[Dict[str, int]]:
+        """
+        캡처 영역 설정 문자열("x,y,너비,높이")을 파싱
+        
+        Args:
+            region_str: 메인 모니터 기준 좌표 문자열
+            
+        Returns:
+            mss 캡처 영역 오프셋 또는 None (전체 화면)
+        """
+        if not region_str:
+            return None
+        
+        try:
+            x, y, width, height = (int(value.strip()) for value in region_str.split(","))
+        except ValueError:
+            print(f"⚠️ SCREEN_CAPTURE_REGION 형식이 잘못되었습니다. 'x,y,너비,높이' 형식으로 설정해주세요. (현재 값: {region_str})")
+            return None
+        
+        if x < 0 or y < 0 or width <= 0 or height <= 0:
+            print(f"⚠️ SCREEN_CAPTURE_REGION 값이 올바르지 않습니다. (현재 값: {region_str})")
+            return None
+        
+        return {"left": x, "top": y, "width": width, "height": height}
+    
     def capture_screen(self) -> Optional[np.ndarray]:
         """
-        화면 캡처
+        화면 캡처 (캡처 영역이 설정되어 있으면 해당 영역만)
         
         Returns:
-            캡처된 화면 이미지 (numpy array) 또는 None
+            캡처된 화면의 그레이스케일 이미지 (numpy array) 또는 None
         """
+        if self._camera:
+            try:
+                latest = self._camera.get_latest_frame()
+                if latest is not None:
+                    # 캡처 스레드가 버퍼를 덮어쓰지 않도록 재사용 버퍼로 복사
+                    gray = latest.reshape(latest.shape[0], latest.shape[1])
+                    if self._gray_buf is None or self._gray_buf.shape != gray.shape:
+                        self._gray_buf = np.empty(gray.shape, dtype=np.uint8)
+                    np.copyto(self._gray_buf, gray)
+                    return self._gray_buf
+            except Exception as e:
+                print(f"⚠️ bettercam 캡처 오류, mss로 재시도합니다: {e}")
+        
         try:
             with mss.mss() as sct:
                 # 메인 모니터 캡처
                 monitor = sct.monitors[1]
+                if self.capture_region:
+                    # Zep 참가자 영역만 잘라서 캡처 (OCR/얼굴 감지 픽셀 수 감소)
+                    monitor = {
+                        "left": monitor["left"] + self.capture_region["left"],
+                        "top": monitor["top"] + self.capture_region["top"],
+                        "width": self.capture_region["width"],
+                        "height": self.capture_region["height"],
+                    }
                 screenshot = sct.grab(monitor)
                 
-                # numpy array로 변환
-                img = np.array(screenshot)
-                
-                # BGRA → BGR 변환 (OpenCV 형식)
-                frame = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+                # 복사 없이 mss 버퍼를 numpy array로 사용
+                img = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+                    screenshot.height, screenshot.width, 4
+                )
                 
-                return frame
+                # OCR/얼굴 감지 모두 그레이스케일만 사용하므로 BGRA → GRAY 한 번에 변환
+                shape = (screenshot.height, screenshot.width)
+                if self._gray_buf is None or self._gray_buf.shape != shape:
+                    self._gray_buf = np.empty(shape, dtype=np.uint8)
+                return cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY, dst=self._gray_buf)
         except Exception as e:
             print(f"❌ 화면 캡처 오류: {e}")
             return None
@@ -176,7 +359,7 @@ class ScreenMonitor:
         화면에서 학생 이름 + 얼굴 감지
         
         Args:
-            frame: 캡처된 화면
+            frame: 캡처된 화면 (그레이스케일)
             student_names: 감지할 학생 이름 목록
             
         Returns:
@@ -203,7 +386,7 @@ class ScreenMonitor:
         OCR로 화면에서 학생 이름 찾기
         
         Args:
-            frame: 캡처된 화면
+            frame: 캡처된 화면 (그레이스케일)
             student_names: 학생 이름 목록
             
         Returns:
@@ -212,129 +395,133 @@ class ScreenMonitor:
         detected = set()
         
         try:
-            # 이미지 전처리 (여러 방법)
-            processed_images = self._preprocess_for_ocr(frame)
-            
-            all_texts = []
-            
-            # 여러 전처리 방법으로 OCR 시도
-            for i, processed in enumerate(processed_images):
-                try:
-                    # Tesseract OCR 실행
-                    custom_config = r'--oem 3 --psm 11'
-                    text = pytesseract.image_to_string(
-                        processed,
-                        lang='kor+eng',
-                        config=custom_config
-                    )
-                    all_texts.append(text)
-                except Exception as e:
-                    print(f"   ⚠️ OCR 시도 {i+1} 실패: {e}")
+            # 화면이 바뀌지 않았으면 직전 OCR 결과 재사용 (해시 비용 << OCR 비용)
+            frame_hash = hashlib.blake2b(np.ascontiguousarray(frame), digest_size=16).digest()
+            if frame_hash == self._last_ocr_hash:
+                text = self._last_ocr_text
+            else:
+                # 이미지 전처리 (CLAHE + Otsu 이진화 한 번)
+                processed = self._preprocess_for_ocr(frame)
+                
+                # Tesseract OCR 실행 (균일한 텍스트 블록으로 보고 한 번만 호출)
+                text = self._run_ocr(processed)
+                self._last_ocr_hash = frame_hash
+                self._last_ocr_text = text
             
             # OCR 결과에서 학생 이름 찾기
-            for text in all_texts:
-                for student_name in student_names:
-                    # 학생 이름이 OCR 결과에 있는지 확인
-                    if self._match_name_in_text(student_name, text, student_names):
-                        detected.add(student_name)
+            detected.update(self._match_names_in_text(student_names, text))
         
         except Exception as e:
             print(f"   ⚠️ OCR 감지 오류: {e}")
         
         return detected
     
-    def _preprocess_for_ocr(self, image: np.ndarray) -> List[np.ndarray]:
+    def _run_ocr(self, image: np.ndarray) -> str:
         """
-        OCR을 위한 이미지 전처리 (여러 방법)
+        전처리된 이미지에 OCR 실행
         
         Args:
-            image: 원본 이미지
+            image: 전처리된 이진 이미지
             
         Returns:
-            전처리된 이미지 리스트
+            인식된 텍스트
         """
-        results = []
-        
-        # 그레이스케일 변환
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
-        # 방법 1: 해상도 2배 업스케일 + Otsu 이진화
-        resized = cv2.resize(gray, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
-        denoised = cv2.fastNlMeansDenoising(resized, None, 10, 7, 21)
-        _, binary1 = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        results.append(binary1)
-        
-        # 방법 2: CLAHE + 이진화
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        enhanced = clahe.apply(gray)
-        _, binary2 = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        results.append(binary2)
-        
-        # 방법 3: 어댑티브 이진화
-        adaptive = cv2.adaptiveThreshold(
-            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-            cv2.THRESH_BINARY, 11, 2
+        if self.tess_api:
+            with self._ocr_lock:
+                self.tess_api.SetImage(Image.fromarray(image))
+                return self.tess_api.GetUTF8Text()
+        
+        return pytesseract.image_to_string(
+            image,
+            lang='kor+eng',
+            config=self.ocr_config
         )
-        results.append(adaptive)
+    
+    def _preprocess_for_ocr(self, gray: np.ndarray) -> np.ndarray:
+        """
+        OCR을 위한 이미지 전처리
+        
+        화면 캡처는 노이즈가 없는 렌더링 텍스트이므로
+        대비 보정(CLAHE) 후 Otsu 이진화만 적용합니다.
+        
+        Args:
+            gray: 그레이스케일 화면 이미지
+            
+        Returns:
+            전처리된 이진 이미지
+        """
+        # CLAHE + 이진화
+        enhanced = self._clahe.apply(gray)
+        _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
         
-        return results
+        return binary
     
-    def _match_name_in_text(self, student_name: str, ocr_text: str, all_student_names: List[str]) -> bool:
+    def _match_names_in_text(self, student_names: List[str], ocr_text: str) -> Set[str]:
         """
         OCR 텍스트에서 학생 이름 매칭
         
+        텍스트 정리와 단어 분리는 한 번만 하고, 완전 일치로 찾지 못한
+        학생만 유사도 매칭을 수행합니다.
+        
         Args:
-            student_name: 찾을 학생 이름
+            student_names: 찾을 학생 이름 목록
             ocr_text: OCR 결과 텍스트
-            all_student_names: 전체 학생 명단
             
         Returns:
-            매칭 여부
+            매칭된 학생 이름 집합
         """
         # 공백/특수문자 제거
-        clean_text = ''.join(c for c in ocr_text if c.isalnum() or ord('가') <= ord(c) <= ord('힣'))
+        clean_text = _NON_NAME_CHARS.sub('', ocr_text)
         
         # 완전 일치
-        if student_name in clean_text:
-            return True
-        
-        # 유사도 매칭 (get_close_matches)
-        words = ocr_text.split()
-        matches = get_close_matches(student_name, words, n=1, cutoff=0.8)
-        if matches:
-            return True
-        
-        # Levenshtein 거리 (1~2글자 차이 허용)
-        if LEVENSHTEIN_AVAILABLE:
-            for word in words:
-                clean_word = ''.join(c for c in word if c.isalnum() or ord('가') <= ord(c) <= ord('힣'))
-                if clean_word and levenshtein_distance(student_name, clean_word) == 0:
-                    return True
-        
-        return False
+        matched = {name for name in student_names if name in clean_text}
+        remaining = [name for name in student_names if name not in matched]
+        if not remaining:
+            return matched
+        
+        # 중복 단어 제거 후 유사도 매칭 (유사도 80% 이상)
+        words = list(dict.fromkeys(ocr_text.split()))
+        
+        for student_name in remaining:
+            if RAPIDFUZZ_AVAILABLE:
+                if process.extractOne(student_name, words, scorer=fuzz.ratio, score_cutoff=80):
+                    matched.add(student_name)
+            elif get_close_matches(student_name, words, n=1, cutoff=0.8):
+                matched.add(student_name)
+        
+        return matched
     
     def _count_faces(self, frame: np.ndarray) -> int:
         """
         화면에서 얼굴 개수 세기
         
         Args:
-            frame: 캡처된 화면
+            frame: 캡처된 화면 (그레이스케일)
             
         Returns:
             감지된 얼굴 개수
         """
-        if not self.face_cascade:
+        if self.face_detector is None and not self.face_cascade:
             return 0
         
         try:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            if self.face_detector is not None:
+                # YuNet은 3채널 입력만 받으므로 그레이스케일을 BGR로 확장
+                height, width = frame.shape[:2]
+                self.face_detector.setInputSize((width, height))
+                _, faces = self.face_detector.detect(cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR))
+                return 0 if faces is None else len(faces)
             
-            # 얼굴 감지
+            # 얼굴 감지 (capture_screen이 이미 그레이스케일로 반환)
+            # Zep 타일의 얼굴은 충분히 크므로 절반 해상도 + 성긴 피라미드로 탐색
+            # (개수만 사용하므로 좌표 복원은 필요 없음)
+            small = cv2.resize(frame, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
             faces = self.face_cascade.detectMultiScale(
-                gray,
-                scaleFactor=1.1,
-                minNeighbors=5,
-                minSize=(30, 30)
+                small,
+                scaleFactor=1.2,
+                minNeighbors=4,
+                minSize=(30, 30),
+                maxSize=(200, 200)
             )
             
             return len(faces)
@@ -4,8 +4,14 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 PERSISTED_FIELDS: Dict[str, str] = {
     "camera_off_threshold": "CAMERA_OFF_THRESHOLD",
@@ -30,16 +36,68 @@ PERSISTED_FIELDS: Dict[str, str] = {
 
 SETTINGS_FILE = Path(__file__).parent.parent / "data" / "settings.json"
 
+# 마지막으로 파싱한 설정 파일 (수정 시각, 크기)와 내용 - 파일이 바뀌지 않았으면 재파싱하지 않음
+_settings_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
 
-def load_persisted_settings(config) -> None:
-    """디스크에 저장된 설정 값을 불러와 Config 인스턴스에 적용"""
-    if not SETTINGS_FILE.exists():
-        return
+
+def _read_settings_file() -> Dict[str, Any]:
+    """설정 파일 전체를 dict로 읽음 (없거나 손상되었으면 빈 dict)"""
+    global _settings_cache
+
+    try:
+        stat = SETTINGS_FILE.stat()
+    except OSError:
+        return {}
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    if _settings_cache is not None and _settings_cache[0] == signature:
+        return dict(_settings_cache[1])
 
     try:
-        data = json.loads(SETTINGS_FILE.read_text(encoding="utf-8"))
+        raw = SETTINGS_FILE.read_bytes()
+        data = orjson.loads(raw) if orjson else json.loads(raw.decode("utf-8"))
     except Exception:
-        return
+        return {}
+    if not isinstance(data, dict):
+        return {}
+
+    _settings_cache = (signature, data)
+    return dict(data)
+
+
+def read_persisted_settings() -> Dict[str, Any]:
+    """settings.json 전체 내용 (변경되지 않았으면 캐시된 값)"""
+    return _read_settings_file()
+
+
+def _write_settings_file(data: Dict[str, Any]) -> None:
+    """임시 파일에 쓴 뒤 교체하여 저장 중 중단되어도 파일이 깨지지 않도록 함"""
+    global _settings_cache
+
+    SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = SETTINGS_FILE.with_suffix(".json.tmp")
+    tmp_file.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp_file, SETTINGS_FILE)
+    _settings_cache = None
+
+
+def update_persisted_values(values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    설정 파일의 일부 키만 갱신 (다른 키는 보존, 변경이 없으면 쓰지 않음)
+
+    Returns:
+        갱신 후 전체 설정 값
+    """
+    current = _read_settings_file()
+    updated = {**current, **values}
+    if updated != current:
+        _write_settings_file(updated)
+    return updated
+
+
+def load_persisted_settings(config) -> None:
+    """디스크에 저장된 설정 값을 불러와 Config 인스턴스에 적용"""
+    data = _read_settings_file()
 
     for field, attr in PERSISTED_FIELDS.items():
         if field in data:
@@ -50,9 +108,7 @@ def load_persisted_settings(config) -> None:
 
 
 def save_persisted_settings(config, extra_values: Dict[str, Any] | None = None) -> None:
-    """현재 Config 값을 디스크에 저장"""
-    SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-
+    """현재 Config 값을 디스크에 저장 (ignore_keywords 등 다른 키는 유지)"""
     payload: Dict[str, Any] = {}
     for field, attr in PERSISTED_FIELDS.items():
         payload[field] = getattr(config, attr, None)
@@ -60,5 +116,4 @@ def save_persisted_settings(config, extra_values: Dict[str, Any] | None = None)
     if extra_values:
         payload.update(extra_values)
 
-    SETTINGS_FILE.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-
+    update_persisted_values(payload)
@@ -3,11 +3,11 @@ Slack Socket Mode 리스너
 ZEP로부터 Slack 채널에 전송된 메시지를 실시간으로 감지하고 파싱합니다.
 """
 import re
+import time
 import asyncio
-import json
 import logging
-from pathlib import Path
-from typing import Optional, Dict, Tuple, List
+import aiohttp
+from typing import Optional, Dict, Tuple, List, NamedTuple
 from datetime import datetime, timedelta, timezone
 from asyncio import Queue
 from slack_bolt.async_app import AsyncApp
@@ -16,29 +16,149 @@ from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 from config import config
 from database import DBService
 from api.websocket_manager import manager
+from services.settings_store import read_persisted_settings
 from utils.name_utils import extract_all_korean_names, extract_name_only
 
+# RE2 (선택사항: 설치 시 선형 시간 DFA 엔진으로 이벤트 분류)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# ZEP 이벤트 메시지 패턴 (우선순위 순서: 카메라 ON → 카메라 OFF → 퇴장 → 입장, 한글 → 영어)
+# 이름 그룹만 캡처하고, 그룹 이름으로 이벤트 종류를 구분하여 한 번의 검색으로 분류
+# 이름(최대 40자)과 "님이" 뒤 문구(최대 100자)의 길이를 제한해 긴 메시지에서의 과도한 백트래킹 방지
+_EVENT_PATTERNS = (
+    ("camera_on", r"\*?(?P<camera_on>[^\s\[\]:]{1,40}?)\*?\s*님(?:의|이)?\s*카메라(?:를|가)\s*(?:켰습니다|on\s*되었습니다)"),
+    ("camera_on_en", r"(?i:(?P<camera_on_en>[^\s\[\]:]{1,40}?)\s*'?s?\s*camera\s*has\s*been\s*turned\s*on)"),
+    ("camera_off", r"\*?(?P<camera_off>[^\s\[\]:]{1,40}?)\*?\s*님(?:의|이)?\s*카메라(?:를|가)\s*(?:껐습니다|off\s*되었습니다)"),
+    ("camera_off_en", r"(?i:(?P<camera_off_en>[^\s\[\]:]{1,40}?)\s*'?s?\s*camera\s*has\s*been\s*turned\s*off)"),
+    ("user_leave", r"\*?(?P<user_leave>[^\s\[\]:]{1,40}?)\*?\s*님이?\s*.{0,100}(?:퇴장|접속\s*종료|접속을\s*종료|나갔습니다)"),
+    ("user_leave_en", r"(?i:(?P<user_leave_en>[^\s\[\]:]{1,40}?)\s*(?:님이?)?\s*(?:has\s*)?(?:left|exited|disconnected))"),
+    ("user_join", r"\*?(?P<user_join>[^\s\[\]:]{1,40}?)\*?\s*님이?\s*.{0,100}(?:입장|접속했습니다|들어왔습니다)"),
+    ("user_join_en", r"(?i:(?P<user_join_en>[^\s\[\]:]{1,40}?)\s*(?:님이?)?\s*(?:has\s*)?(?:entered|joined|connected))"),
+)
+
+
+def _compile_event_pattern(pattern: str):
+    """
+    이벤트 패턴 컴파일 (RE2 우선, 실패 시 표준 re)
+
+    Args:
+        pattern: 결합된 이벤트 정규식
+
+    Returns:
+        컴파일된 패턴 객체
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except Exception as e:
+            logger.warning(f"[Slack] RE2 패턴 컴파일 실패, 표준 re 사용: {e}")
+    return re.compile(pattern)
+
+
+_EVENT_PATTERN = _compile_event_pattern("|".join(pattern for _, pattern in _EVENT_PATTERNS))
+_EVENT_TYPES: Dict[str, str] = {group: group.removesuffix("_en") for group, _ in _EVENT_PATTERNS}
+
+# 이벤트 검색 대상 최대 길이 (ZEP 알림은 한 문장이므로 앞부분만 검사)
+_MAX_EVENT_TEXT_LENGTH = 1000
+
+# 중복 이벤트 기록 보관 시간 (초)과 정리 주기 (기록 횟수)
+_EVENT_TIME_TTL = 60
+_EVENT_TIME_PRUNE_EVERY = 1000
+
+# DB에 없는 ZEP 이름 재조회 방지 (보관 시간 초, 최대 개수)
+_UNKNOWN_NAME_TTL = 60
+_UNKNOWN_NAME_MAX = 1000
+
+# 상태 변경 브로드캐스트를 모으는 시간창 (초, 같은 학생의 ON/OFF 깜빡임은 마지막 상태만 전송)
+_BROADCAST_BATCH_WINDOW = 0.2
+
+# 이벤트 메시지라면 반드시 포함하는 키워드 (정규식 검색 전 빠른 사전 필터, 영어는 소문자 비교)
+_EVENT_KEYWORDS = (
+    "카메라", "퇴장", "접속", "나갔", "입장", "들어왔",
+    "camera", "left", "exited", "connected", "entered", "joined",
+)
+
+# 이벤트 종류별 로그 표기
+_EVENT_LABELS = {
+    "camera_on": "카메라 ON",
+    "camera_off": "카메라 OFF",
+    "user_join": "입장",
+    "user_leave": "퇴장",
+}
+
+
+class _EventSpec(NamedTuple):
+    """이벤트 종류별 처리 방식"""
+    is_cam_on: bool          # 갱신할 카메라 상태
+    clear_absent: bool       # 외출/조퇴 상태 초기화
+    clear_not_joined: bool   # 수업 시간이면 미접속 상태 해제
+    mark_joined: bool        # 오늘 접속한 학생으로 기록
+    record_leave: bool       # 접속 종료 시간 기록
+    now_if_missing: bool     # 메시지 시각이 없으면 현재 시각 사용
+
+
+_EVENT_SPECS: Dict[str, _EventSpec] = {
+    "camera_on": _EventSpec(is_cam_on=True, clear_absent=True, clear_not_joined=True, mark_joined=True, record_leave=False, now_if_missing=True),
+    "camera_off": _EventSpec(is_cam_on=False, clear_absent=False, clear_not_joined=False, mark_joined=True, record_leave=False, now_if_missing=True),
+    "user_join": _EventSpec(is_cam_on=False, clear_absent=True, clear_not_joined=True, mark_joined=True, record_leave=False, now_if_missing=False),
+    "user_leave": _EventSpec(is_cam_on=False, clear_absent=False, clear_not_joined=False, mark_joined=False, record_leave=True, now_if_missing=False),
+}
+
+# 무시 키워드 검사용 이름 구분자
+_IGNORE_SPLIT_PATTERN = re.compile(r"[/_\-.\s()]+")
+
+
+def _ts_to_datetime(message_ts: float) -> Optional[datetime]:
+    """Slack 메시지 Unix timestamp를 UTC datetime으로 변환 (0 이하면 None)"""
+    return datetime.fromtimestamp(message_ts, tz=timezone.utc) if message_ts > 0 else None
+
+
+def match_event(text: str) -> Optional[Tuple[str, str]]:
+    """
+    ZEP 메시지에서 이벤트 종류와 ZEP 이름 추출
+
+    Returns:
+        (이벤트 종류, ZEP 이름 원문) 또는 이벤트 메시지가 아니면 None
+    """
+    lowered = text.lower()
+    if not any(keyword in lowered for keyword in _EVENT_KEYWORDS):
+        return None
+
+    match = _EVENT_PATTERN.search(text[:_MAX_EVENT_TEXT_LENGTH])
+    if not match:
+        return None
+    group = match.lastgroup
+    return _EVENT_TYPES[group], match.group(group)
+
 
 class SlackListener:
     def __init__(self, monitor_service=None):
         self.app = AsyncApp(token=config.SLACK_BOT_TOKEN)
 
         self.handler = None
+        self.http_session: Optional[aiohttp.ClientSession] = None
         self.db_service = DBService()
         self.monitor_service = monitor_service
-        self.start_time = datetime.now().timestamp()
+        self.start_time = time.time()
         self.is_restoring = False
         self.joined_students_today = set()
 
         self.last_event_times: Dict[Tuple[int, str], float] = {}
         self.duplicate_threshold = 0.01
+        self.event_times_inserts = 0  # last_event_times 정리 주기 카운터
         self.student_cache: Dict[str, int] = {}
+        self.resolved_names: Dict[str, Tuple[Optional[int], Optional[str]]] = {}  # 복원 중 ZEP 이름 원문 -> (학생 ID, DB 이름)
+        self.unknown_names: Dict[str, float] = {}  # 매칭 실패한 ZEP 이름 원문 -> 실패 시각 (monotonic)
         self.logged_match_failures: set = set()  # 이미 로그 출력한 매칭 실패 이름들
 
         # 폴링 메커니즘 (Socket Mode 누락 메시지 보완)
-        self.last_poll_timestamp = datetime.now().timestamp()
+        self.last_poll_timestamp = time.time()
         self.polling_interval = 5  # 5초마다 폴링
         self.polling_task = None
 
@@ -49,41 +169,30 @@ class SlackListener:
         # 초기화 중 이벤트 큐
         self.pending_events: Queue = Queue()
         self.processing_pending = False
+
+        # 실시간 메시지 / 브로드캐스트 큐 (각각 단일 워커가 순서대로 처리)
+        self.message_queue: Queue = Queue(maxsize=10000)
+        self.message_worker_task = None
+        self.broadcast_queue: Queue = Queue(maxsize=10000)
+        self.broadcast_worker_task = None
         
-        self.role_keywords = {
+        self.role_keywords = frozenset({
             "조교", "주강사", "멘토", "매니저", "코치",
             "개발자", "학생", "수강생", "교육생",
             "강사", "관리자", "운영자", "팀장", "회장",
             "강의", "실습", "프로젝트", "팀"
-        }
+        })
         self.ignore_keywords: List[str] = self._load_ignore_keywords()
         
-        # 한글 패턴
-        self.pattern_cam_on = re.compile(r"\*?([^\s\[\]:]+?)\*?\s*님(?:의|이)?\s*카메라(?:를|가)\s*(?:켰습니다|on\s*되었습니다)")
-        self.pattern_cam_off = re.compile(r"\*?([^\s\[\]:]+?)\*?\s*님(?:의|이)?\s*카메라(?:를|가)\s*(?:껐습니다|off\s*되었습니다)")
-        self.pattern_leave = re.compile(r"\*?([^\s\[\]:]+?)\*?\s*님이?\s*.*(퇴장|접속\s*종료|접속을\s*종료|나갔습니다)(?:했습니다)?")
-        self.pattern_join = re.compile(r"\*?([^\s\[\]:]+?)\*?\s*님이?\s*.*(입장|접속했습니다|들어왔습니다)")
-
-        # 영어 패턴 추가
-        self.pattern_cam_on_en = re.compile(r"([^\s\[\]:]+?)\s*'?s?\s*camera\s*has\s*been\s*turned\s*on", re.IGNORECASE)
-        self.pattern_cam_off_en = re.compile(r"([^\s\[\]:]+?)\s*'?s?\s*camera\s*has\s*been\s*turned\s*off", re.IGNORECASE)
-        self.pattern_join_en = re.compile(r"([^\s\[\]:]+?)\s*(?:님이?)?\s*(?:has\s*)?(?:entered|joined|connected)", re.IGNORECASE)
-        self.pattern_leave_en = re.compile(r"([^\s\[\]:]+?)\s*(?:님이?)?\s*(?:has\s*)?(?:left|exited|disconnected)", re.IGNORECASE)
-
         # 이벤트 핸들러 등록 (모든 메시지 타입 수신)
         self.app.message()(self._handle_all_messages)
     
     def _load_ignore_keywords(self) -> List[str]:
         """설정 파일에서 무시할 키워드 목록 로드"""
-        settings_file = Path(__file__).parent.parent / "data" / "settings.json"
         default_keywords = ["test", "monitor", "debug", "temp"]
         
-        if not settings_file.exists():
-            return default_keywords
-        
         try:
-            data = json.loads(settings_file.read_text(encoding="utf-8"))
-            keywords = data.get("ignore_keywords", default_keywords)
+            keywords = read_persisted_settings().get("ignore_keywords", default_keywords)
             if isinstance(keywords, list):
                 return [str(kw).lower() for kw in keywords if kw]
             return default_keywords
@@ -99,7 +208,7 @@ class SlackListener:
             return False
         
         # 구분자로 분리: _, -, ., 공백, 괄호 등
-        parts = re.split(r'[/_\-.\s()]+', zep_name.lower())
+        parts = _IGNORE_SPLIT_PATTERN.split(zep_name.lower())
         
         # 분리된 부분 중 하나라도 키워드와 일치하면 무시
         for part in parts:
@@ -113,24 +222,30 @@ class SlackListener:
         """중복 이벤트 체크 (0.01초 이내 동일 이벤트만 무시)"""
         key = (student_id, event_type)
         last_time = self.last_event_times.get(key)
-        
-        if last_time is None:
-            self.last_event_times[key] = message_ts
-            return False
-        
-        time_diff = abs(message_ts - last_time)
-
-        if time_diff < self.duplicate_threshold:
+        if last_time is not None and abs(message_ts - last_time) < self.duplicate_threshold:
             return True
 
-        self.last_event_times[key] = message_ts
+        self._record_event_time(key, message_ts)
         return False
+
+    def _record_event_time(self, key: Tuple[int, str], message_ts: float):
+        """이벤트 시각 기록 (주기적으로 오래된 기록을 정리해 메모리 증가 방지)"""
+        self.last_event_times[key] = message_ts
+        self.event_times_inserts += 1
+        if self.event_times_inserts >= _EVENT_TIME_PRUNE_EVERY:
+            self.event_times_inserts = 0
+            self.last_event_times = {
+                k: t for k, t in self.last_event_times.items()
+                if abs(message_ts - t) < _EVENT_TIME_TTL
+            }
     
     async def _refresh_student_cache(self):
         """학생 명단을 메모리에 캐싱 (이름 변형도 포함)"""
         try:
             students = await self.db_service.get_all_students()
             self.student_cache = {}
+            self.resolved_names = {}
+            self.unknown_names = {}
             
             for student in students:
                 self.student_cache[student.zep_name] = student.id
@@ -141,16 +256,114 @@ class SlackListener:
         except Exception:
             pass
     
-    async def _broadcast_status_change(self, student_id: int, zep_name: str, event_type: str, is_cam_on: bool):
-        """브로드캐스트를 비동기로 실행하는 헬퍼 함수"""
+    async def _resolve_student(self, zep_name_raw: str) -> Tuple[Optional[int], Optional[str]]:
+        """
+        ZEP 이름 원문으로 학생 ID와 DB 이름 조회 (캐시 → 후보 일괄 DB 조회)
+
+        히스토리 복원 중에는 같은 원문이 반복되므로 결과를 원문 단위로 재사용합니다.
+
+        Args:
+            zep_name_raw: ZEP 이름 원문
+
+        Returns:
+            (학생 ID, DB 이름) 또는 매칭 실패 시 (None, None)
+        """
+        if self.is_restoring and zep_name_raw in self.resolved_names:
+            return self.resolved_names[zep_name_raw]
+
+        failed_at = self.unknown_names.get(zep_name_raw)
+        if failed_at is not None:
+            if time.monotonic() - failed_at < _UNKNOWN_NAME_TTL:
+                return None, None
+            del self.unknown_names[zep_name_raw]
+
+        korean_names = extract_all_korean_names(zep_name_raw, role_keywords=self.role_keywords)
+
+        # 1. 캐시에서 찾기 (한글 이름 부분 포함)
+        student = None
+        for name in korean_names:
+            if name in self.student_cache:
+                student = await self.db_service.get_student_by_id(self.student_cache[name])
+                if not student:
+                    # 캐시에만 남은 학생: 추출한 이름으로 대체
+                    return self.student_cache[name], extract_name_only(zep_name_raw, role_keywords=self.role_keywords)
+                break
+
+        # 2. 캐시에 없으면 원문 + 한글 이름 후보를 한 번에 DB 조회
+        if not student:
+            student = await self.db_service.get_student_by_any_zep_name([zep_name_raw, *korean_names])
+            if not student:
+                if self.is_restoring:
+                    self.resolved_names[zep_name_raw] = (None, None)
+                else:
+                    self._remember_unknown_name(zep_name_raw)
+                return None, None
+
+            # 캐시에 추가 (원본 이름과 한글 이름 모두)
+            self.student_cache[student.zep_name] = student.id
+            for name in korean_names:
+                if name not in self.student_cache:
+                    self.student_cache[name] = student.id
+
+        resolved = (student.id, student.zep_name)
+        if self.is_restoring:
+            self.resolved_names[zep_name_raw] = resolved
+        return resolved
+
+    def _remember_unknown_name(self, zep_name_raw: str):
+        """매칭 실패 이름 기록 (최대 개수를 넘으면 가장 오래된 기록부터 제거)"""
+        self.unknown_names.pop(zep_name_raw, None)
+        self.unknown_names[zep_name_raw] = time.monotonic()
+        while len(self.unknown_names) > _UNKNOWN_NAME_MAX:
+            del self.unknown_names[next(iter(self.unknown_names))]
+
+    def _log_match_failure(self, event_type: str, zep_name_raw: str):
+        """매칭 실패 로그 (같은 이름은 한 번만, * 제거 후 비교)"""
+        normalized_name = zep_name_raw.strip('*').strip()
+        if normalized_name not in self.logged_match_failures:
+            self.logged_match_failures.add(normalized_name)
+            logger.warning(f"[매칭 실패 - {_EVENT_LABELS[event_type]}] ZEP 이름: '{zep_name_raw}'")
+
+    def _replay_event_values(self, event_type: str, message_ts: float, add_to_joined_today: bool) -> dict:
+        """
+        복원 이벤트 하나가 DB에 쓰는 컬럼 값 (핸들러의 DB 쓰기와 동일한 순서로 합성)
+
+        Args:
+            event_type: 이벤트 종류
+            message_ts: 메시지 Unix timestamp (0이면 시각 없음)
+            add_to_joined_today: 오늘 이벤트 여부
+
+        Returns:
+            컬럼명 -> 값 딕셔너리
+        """
+        spec = _EVENT_SPECS[event_type]
+        values = {}
+        if spec.clear_absent:
+            values.update(self.db_service.absent_clear_values())
+        if spec.record_leave and add_to_joined_today:
+            values.update(self.db_service.user_leave_values())
+
+        timestamp_to_use = self._status_change_time(spec, message_ts, add_to_joined_today)
+        values.update(self.db_service.camera_status_values(spec.is_cam_on, timestamp_to_use))
+        return values
+
+    def _log_status_change(self, event_type: str, matched_name: str, message_ts: float):
+        """상태 변경 로그 (복원 중이거나 INFO 레벨이 꺼져 있으면 포맷팅 생략)"""
+        if self.is_restoring or not logger.isEnabledFor(logging.INFO):
+            return
+        message_timestamp = _ts_to_datetime(message_ts)
+        timestamp_str = message_timestamp.strftime("%H:%M:%S") if message_timestamp else "N/A"
+        logger.info("[%s] %s | 시각: %s", _EVENT_LABELS[event_type], matched_name, timestamp_str)
+
+    async def _broadcast_status_changes(self, batch: List[dict]):
+        """상태 변경 묶음을 전송하고 대시보드는 한 번만 갱신
+
+        Args:
+            batch: broadcast_student_status_changed 인자 dict 목록 (학생별 최신 상태)
+        """
         try:
-            await manager.broadcast_student_status_changed(
-                student_id=student_id,
-                zep_name=zep_name,
-                event_type=event_type,
-                is_cam_on=is_cam_on,
-                elapsed_minutes=0
-            )
+            for kwargs in batch:
+                await manager.broadcast_student_status_changed(**kwargs, elapsed_minutes=0)
             if self.monitor_service:
                 await self.monitor_service.broadcast_dashboard_update_now()
         except Exception:
@@ -160,10 +373,6 @@ class SlackListener:
         """모든 메시지 핸들러 (일반 메시지 + 봇 메시지)"""
         try:
             channel = message.get("channel", "")
-            # blocks에서 텍스트 추출 (attachments 포함)
-            text = self._extract_text_from_blocks(message)
-            message_ts_str = message.get("ts", "")
-            message_ts = float(message_ts_str) if message_ts_str else 0
             subtype = message.get("subtype", "")
 
             # message_changed, message_deleted 등의 이벤트는 조용히 무시
@@ -173,9 +382,49 @@ class SlackListener:
 
             # 기존 채널: 카메라/입장/퇴장
             if channel == config.SLACK_CHANNEL_ID:
-                asyncio.create_task(self._process_message_async(text, message_ts))
+                # blocks에서 텍스트 추출 (attachments 포함)
+                text = self._extract_text_from_blocks(message)
+                message_ts_str = message.get("ts", "")
+                message_ts = float(message_ts_str) if message_ts_str else 0
+                self._enqueue_message(text, message_ts)
         except Exception as e:
             logger.error(f"[Slack 메시지 핸들러 오류] {e}", exc_info=True)
+
+    def _enqueue_message(self, text: str, message_ts: float):
+        """메시지를 처리 큐에 추가 (워커가 도착 순서대로 처리)"""
+        try:
+            self.message_queue.put_nowait((text, message_ts))
+        except asyncio.QueueFull:
+            logger.warning(f"[메시지 큐 가득 참] 메시지 무시: '{text[:100]}'")
+
+    async def _message_worker(self):
+        """메시지 큐를 순서대로 처리하는 워커 (같은 학생의 이벤트 순서 보장)"""
+        while True:
+            text, message_ts = await self.message_queue.get()
+            await self._process_message_async(text, message_ts)
+
+    async def _broadcast_worker(self):
+        """상태 변경 브로드캐스트 큐를 순서대로 전송하는 워커
+
+        짧은 시간창 동안 쌓인 이벤트를 모아 학생별 마지막 상태만 한 번에 보내서
+        이벤트가 몰릴 때 대시보드 전체 갱신이 이벤트마다 반복되지 않게 한다.
+        """
+        while True:
+            first = await self.broadcast_queue.get()
+            await asyncio.sleep(_BROADCAST_BATCH_WINDOW)
+            latest: Dict[int, dict] = {first["student_id"]: first}
+            while not self.broadcast_queue.empty():
+                kwargs = self.broadcast_queue.get_nowait()
+                latest.pop(kwargs["student_id"], None)
+                latest[kwargs["student_id"]] = kwargs
+            await self._broadcast_status_changes(list(latest.values()))
+
+    def _start_workers(self):
+        """메시지/브로드캐스트 워커 시작 (이미 실행 중이면 유지)"""
+        if not self.message_worker_task or self.message_worker_task.done():
+            self.message_worker_task = asyncio.create_task(self._message_worker())
+        if not self.broadcast_worker_task or self.broadcast_worker_task.done():
+            self.broadcast_worker_task = asyncio.create_task(self._broadcast_worker())
     
     async def _process_message_async(self, text: str, message_ts: float):
         """메시지를 비동기로 처리"""
@@ -192,349 +441,94 @@ class SlackListener:
                 })
                 return
             
-            current_time = datetime.now().timestamp()
             if message_ts < self.start_time:
-                if (current_time - message_ts) > 60:
+                if (time.time() - message_ts) > 60:
                     return
-            
-            message_dt = datetime.fromtimestamp(message_ts, tz=timezone.utc) if message_ts > 0 else None
 
-            # 카메라 ON (한글 + 영어)
-            match_on = self.pattern_cam_on.search(text) or self.pattern_cam_on_en.search(text)
-            if match_on:
-                zep_name_raw = match_on.group(1)
-                if self._should_ignore_name(zep_name_raw):
-                    return
-                zep_name = extract_name_only(zep_name_raw, role_keywords=self.role_keywords)
-                await self._handle_camera_on(zep_name_raw, zep_name, message_dt, message_ts)
+            # 카메라 ON/OFF, 퇴장, 입장 (한글 + 영어) - 한 번의 검색으로 분류
+            event = match_event(text)
+            if not event:
                 return
 
-            # 카메라 OFF (한글 + 영어)
-            match_off = self.pattern_cam_off.search(text) or self.pattern_cam_off_en.search(text)
-            if match_off:
-                zep_name_raw = match_off.group(1)
-                if self._should_ignore_name(zep_name_raw):
-                    return
-                zep_name = extract_name_only(zep_name_raw, role_keywords=self.role_keywords)
-                await self._handle_camera_off(zep_name_raw, zep_name, message_dt, message_ts)
-                return
-
-            # 퇴장 (한글 + 영어)
-            match_leave = self.pattern_leave.search(text) or self.pattern_leave_en.search(text)
-            if match_leave:
-                zep_name_raw = match_leave.group(1)
-                if self._should_ignore_name(zep_name_raw):
-                    return
-                zep_name = extract_name_only(zep_name_raw, role_keywords=self.role_keywords)
-                await self._handle_user_leave(zep_name_raw, zep_name, message_dt, message_ts)
+            event_type, zep_name_raw = event
+            if self._should_ignore_name(zep_name_raw):
                 return
 
-            # 입장 (한글 + 영어)
-            match_join = self.pattern_join.search(text) or self.pattern_join_en.search(text)
-            if match_join:
-                zep_name_raw = match_join.group(1)
-                if self._should_ignore_name(zep_name_raw):
-                    return
-                zep_name = extract_name_only(zep_name_raw, role_keywords=self.role_keywords)
-                await self._handle_user_join(zep_name_raw, zep_name, message_dt, message_ts)
-                return
+            await self._dispatch_event(event_type, zep_name_raw, message_ts)
         except Exception as e:
             logger.error(f"[메시지 처리 오류] 텍스트: '{text[:100]}', 오류: {e}", exc_info=True)
-    
-    async def _handle_camera_on(self, zep_name_raw: str, zep_name: str, message_timestamp: Optional[datetime] = None, message_ts: float = 0, add_to_joined_today: bool = True):
-        try:
-            student_id = None
-            matched_name = zep_name
 
-            for name in extract_all_korean_names(zep_name_raw, role_keywords=self.role_keywords):
-                if name in self.student_cache:
-                    student_id = self.student_cache[name]
-                    student = await self.db_service.get_student_by_id(student_id)
-                    if student:
-                        matched_name = student.zep_name
-                    break
+    async def _dispatch_event(self, event_type: str, zep_name_raw: str, message_ts: float = 0, add_to_joined_today: bool = True):
+        """
+        ZEP 이벤트 처리 (이벤트 종류별 차이는 _EVENT_SPECS에 정의)
 
-            if not student_id:
-                student = await self.db_service.get_student_by_zep_name(zep_name_raw)
-                if not student:
-                    for name in extract_all_korean_names(zep_name_raw, role_keywords=self.role_keywords):
-                        student = await self.db_service.get_student_by_zep_name(name)
-                        if student:
-                            break
-
-                if student:
-                    student_id = student.id
-                    matched_name = student.zep_name
-                    self.student_cache[matched_name] = student_id
-                    for name in extract_all_korean_names(zep_name_raw, role_keywords=self.role_keywords):
-                        if name not in self.student_cache:
-                            self.student_cache[name] = student_id
+        Args:
+            event_type: 이벤트 종류 (camera_on, camera_off, user_join, user_leave)
+            zep_name_raw: ZEP 이름 원문
+            message_ts: 메시지 Unix timestamp (0이면 시각 없음, 중복 이벤트 판별에도 사용)
+            add_to_joined_today: 오늘 이벤트 여부
+        """
+        spec = _EVENT_SPECS[event_type]
+        try:
+            student_id, matched_name = await self._resolve_student(zep_name_raw)
 
             if not student_id:
-                # 중복 로그 방지: 같은 이름은 한 번만 로그 (* 제거 후 비교)
-                normalized_name = zep_name_raw.strip('*').strip()
-                if normalized_name not in self.logged_match_failures:
-                    self.logged_match_failures.add(normalized_name)
-                    logger.warning(f"[매칭 실패 - 카메라 ON] ZEP 이름: '{zep_name_raw}'")
+                self._log_match_failure(event_type, zep_name_raw)
                 return
 
-            if self._is_duplicate_event(student_id, "camera_on", message_ts):
+            if self._is_duplicate_event(student_id, event_type, message_ts):
                 return
 
             if (
-                add_to_joined_today
+                spec.clear_not_joined
+                and add_to_joined_today
                 and not self.is_restoring
                 and self.monitor_service
                 and self.monitor_service._is_class_time()
             ):
                 await self.db_service.clear_not_joined_status(student_id)
 
-            if add_to_joined_today:
+            if spec.mark_joined and add_to_joined_today:
                 self.joined_students_today.add(student_id)
-            await self.db_service.clear_absent_status(student_id)
-            # 오늘 이벤트가 아니면 last_status_change 업데이트 안함
-            # message_timestamp가 None이면 현재 시간 사용 (실시간 이벤트 처리)
-            if add_to_joined_today:
-                timestamp_to_use = message_timestamp if message_timestamp else datetime.now(timezone.utc)
-            else:
-                timestamp_to_use = None
-            success = await self.db_service.update_camera_status(
-                matched_name,
-                True,
-                timestamp_to_use,
-                is_restoring=self.is_restoring
-            )
-
-            if not success:
-                return
-
-            # 상태 변경 로그
-            timestamp_str = message_timestamp.strftime("%H:%M:%S") if message_timestamp else "N/A"
-            logger.info(f"[카메라 ON] {matched_name} | 시각: {timestamp_str}")
-
-            if not self.is_restoring:
-                asyncio.create_task(self._broadcast_status_change(
-                    student_id=student_id,
-                    zep_name=matched_name,
-                    event_type='camera_on',
-                    is_cam_on=True
-                ))
-        except Exception as e:
-            logger.error(f"[카메라 ON 처리 실패] ZEP: {zep_name_raw}, 오류: {e}", exc_info=True)
-    
-    async def _handle_camera_off(self, zep_name_raw: str, zep_name: str, message_timestamp: Optional[datetime] = None, message_ts: float = 0, add_to_joined_today: bool = True):
-        try:
-            student_id = None
-            matched_name = zep_name
-            
-            for name in extract_all_korean_names(zep_name_raw, role_keywords=self.role_keywords):
-                if name in self.student_cache:
-                    student_id = self.student_cache[name]
-                    student = await self.db_service.get_student_by_id(student_id)
-                    if student:
-                        matched_name = student.zep_name
-                    break
-            
-            if not student_id:
-                student = await self.db_service.get_student_by_zep_name(zep_name_raw)
-                if not student:
-                    for name in extract_all_korean_names(zep_name_raw, role_keywords=self.role_keywords):
-                        student = await self.db_service.get_student_by_zep_name(name)
-                        if student:
-                            break
-                
-                if student:
-                    student_id = student.id
-                    matched_name = student.zep_name
-                    self.student_cache[matched_name] = student_id
-                    for name in extract_all_korean_names(zep_name_raw, role_keywords=self.role_keywords):
-                        if name not in self.student_cache:
-                            self.student_cache[name] = student_id
 
-            if not student_id:
-                # 중복 로그 방지: 같은 이름은 한 번만 로그 (* 제거 후 비교)
-                normalized_name = zep_name_raw.strip('*').strip()
-                if normalized_name not in self.logged_match_failures:
-                    self.logged_match_failures.add(normalized_name)
-                    logger.warning(f"[매칭 실패 - 카메라 OFF] ZEP 이름: '{zep_name_raw}'")
-                return
-
-            if self._is_duplicate_event(student_id, "camera_off", message_ts):
-                return
-            
-            if add_to_joined_today:
-                self.joined_students_today.add(student_id)
-            # 오늘 이벤트가 아니면 last_status_change 업데이트 안함
-            # message_timestamp가 None이면 현재 시간 사용 (실시간 이벤트 처리)
-            if add_to_joined_today:
-                timestamp_to_use = message_timestamp if message_timestamp else datetime.now(timezone.utc)
-            else:
-                timestamp_to_use = None
+            # 외출/조퇴 상태 초기화, 접속 종료 시간 기록, 카메라 상태 갱신을 한 번의 UPDATE로 처리
             success = await self.db_service.update_camera_status(
                 matched_name,
-                False,
-                timestamp_to_use,
-                is_restoring=self.is_restoring
+                spec.is_cam_on,
+                self._status_change_time(spec, message_ts, add_to_joined_today),
+                is_restoring=self.is_restoring,
+                clear_absent=spec.clear_absent,
+                record_leave=spec.record_leave and add_to_joined_today
             )
 
             if not success:
                 return
 
-            # 상태 변경 로그
-            timestamp_str = message_timestamp.strftime("%H:%M:%S") if message_timestamp else "N/A"
-            logger.info(f"[카메라 OFF] {matched_name} | 시각: {timestamp_str}")
+            self._log_status_change(event_type, matched_name, message_ts)
 
             if not self.is_restoring:
-                asyncio.create_task(self._broadcast_status_change(
-                    student_id=student_id,
-                    zep_name=matched_name,
-                    event_type='camera_off',
-                    is_cam_on=False
-                ))
-        except Exception as e:
-            logger.error(f"[카메라 OFF 처리 실패] ZEP: {zep_name_raw}, 오류: {e}", exc_info=True)
-    
-    async def _handle_user_join(self, zep_name_raw: str, zep_name: str, message_timestamp: Optional[datetime] = None, message_ts: float = 0, add_to_joined_today: bool = True):
-        try:
-            student_id = None
-            matched_name = zep_name
-
-            extracted = extract_all_korean_names(zep_name_raw, role_keywords=self.role_keywords)
-
-            for name in extracted:
-                if name in self.student_cache:
-                    student_id = self.student_cache[name]
-                    student = await self.db_service.get_student_by_id(student_id)
-                    if student:
-                        matched_name = student.zep_name
-                    break
-
-            if not student_id:
-                student = await self.db_service.get_student_by_zep_name(zep_name_raw)
-                if not student:
-                    extracted_names = extract_all_korean_names(zep_name_raw, role_keywords=self.role_keywords)
-                    for name in extracted_names:
-                        student = await self.db_service.get_student_by_zep_name(name)
-                        if student:
-                            break
-
-                if student:
-                    student_id = student.id
-                    matched_name = student.zep_name
-                    self.student_cache[matched_name] = student_id
-                    for name in extract_all_korean_names(zep_name_raw, role_keywords=self.role_keywords):
-                        if name not in self.student_cache:
-                            self.student_cache[name] = student_id
-
-            if not student_id:
-                # 중복 로그 방지: 같은 이름은 한 번만 로그 (* 제거 후 비교)
-                normalized_name = zep_name_raw.strip('*').strip()
-                if normalized_name not in self.logged_match_failures:
-                    self.logged_match_failures.add(normalized_name)
-                    logger.warning(f"[매칭 실패 - 입장] ZEP 이름: '{zep_name_raw}'")
-                return
-
-            if self._is_duplicate_event(student_id, "user_join", message_ts):
-                return
-            
-            if (
-                add_to_joined_today
-                and not self.is_restoring
-                and self.monitor_service
-                and self.monitor_service._is_class_time()
-            ):
-                await self.db_service.clear_not_joined_status(student_id)
-
-            if add_to_joined_today:
-                self.joined_students_today.add(student_id)
-
-            await self.db_service.clear_absent_status(student_id)
-            # 오늘 이벤트가 아니면 last_status_change 업데이트 안함
-            timestamp_to_use = message_timestamp if add_to_joined_today else None
-            success = await self.db_service.update_camera_status(matched_name, False, timestamp_to_use, is_restoring=self.is_restoring)
-
-            # 상태 변경 로그
-            if success:
-                timestamp_str = message_timestamp.strftime("%H:%M:%S") if message_timestamp else "N/A"
-                logger.info(f"[입장] {matched_name} | 시각: {timestamp_str}")
-
-            if success and not self.is_restoring:
-                asyncio.create_task(self._broadcast_status_change(
-                    student_id=student_id,
-                    zep_name=matched_name,
-                    event_type='user_join',
-                    is_cam_on=False
-                ))
-        except Exception as e:
-            logger.error(f"[입장 처리 실패] ZEP: {zep_name_raw}, 오류: {e}", exc_info=True)
-    
-    async def _handle_user_leave(self, zep_name_raw: str, zep_name: str, message_timestamp: Optional[datetime] = None, message_ts: float = 0, add_to_joined_today: bool = True):
-        try:
-            student_id = None
-            matched_name = zep_name
-            korean_names = extract_all_korean_names(zep_name_raw, role_keywords=self.role_keywords)
-            
-            # 1. 캐시에서 찾기 (한글 이름 부분 포함)
-            for name in korean_names:
-                if name in self.student_cache:
-                    student_id = self.student_cache[name]
-                    # 실제 DB 이름 찾기
-                    student = await self.db_service.get_student_by_id(student_id)
-                    if student:
-                        matched_name = student.zep_name
-                    break
-            
-            # 2. 캐시에 없으면 DB에서 부분 일치로 찾기
-            if not student_id:
-                student = await self.db_service.get_student_by_zep_name(zep_name_raw)
-                if not student:
-                    # 한글 이름 부분으로도 시도
-                    for name in korean_names:
-                        student = await self.db_service.get_student_by_zep_name(name)
-                        if student:
-                            break
-                
-                if student:
-                    student_id = student.id
-                    matched_name = student.zep_name
-                    # 캐시에 추가 (원본 이름과 한글 이름 모두)
-                    self.student_cache[matched_name] = student_id
-                    for name in korean_names:
-                        if name not in self.student_cache:
-                            self.student_cache[name] = student_id
-
-            if not student_id:
-                # 중복 로그 방지: 같은 이름은 한 번만 로그 (* 제거 후 비교)
-                normalized_name = zep_name_raw.strip('*').strip()
-                if normalized_name not in self.logged_match_failures:
-                    self.logged_match_failures.add(normalized_name)
-                    logger.warning(f"[매칭 실패 - 퇴장] ZEP 이름: '{zep_name_raw}'")
-                return
-
-            if self._is_duplicate_event(student_id, "user_leave", message_ts):
-                return
-
-            # 오늘 이벤트만 퇴장 시간 기록
-            if add_to_joined_today:
-                await self.db_service.record_user_leave(student_id)
-            # 오늘 이벤트가 아니면 last_status_change 업데이트 안함
-            timestamp_to_use = message_timestamp if add_to_joined_today else None
-            success = await self.db_service.update_camera_status(matched_name, False, timestamp_to_use, is_restoring=self.is_restoring)
-
-            # 상태 변경 로그
-            if success:
-                timestamp_str = message_timestamp.strftime("%H:%M:%S") if message_timestamp else "N/A"
-                logger.info(f"[퇴장] {matched_name} | 시각: {timestamp_str}")
-
-            if success and not self.is_restoring:
-                asyncio.create_task(self._broadcast_status_change(
-                    student_id=student_id,
-                    zep_name=matched_name,
-                    event_type='user_leave',
-                    is_cam_on=False
-                ))
+                try:
+                    self.broadcast_queue.put_nowait({
+                        "student_id": student_id,
+                        "zep_name": matched_name,
+                        "event_type": event_type,
+                        "is_cam_on": spec.is_cam_on
+                    })
+                except asyncio.QueueFull:
+                    logger.warning(f"[브로드캐스트 큐 가득 참] {matched_name} 상태 변경 알림 생략")
         except Exception as e:
-            logger.error(f"[퇴장 처리 실패] ZEP: {zep_name_raw}, 오류: {e}", exc_info=True)
+            logger.error(f"[{_EVENT_LABELS[event_type]} 처리 실패] ZEP: {zep_name_raw}, 오류: {e}", exc_info=True)
+
+    @staticmethod
+    def _status_change_time(spec: _EventSpec, message_ts: float, add_to_joined_today: bool) -> Optional[datetime]:
+        """last_status_change에 기록할 시각 (오늘 이벤트가 아니면 None으로 갱신 안함, 필요할 때만 datetime 생성)"""
+        if not add_to_joined_today:
+            return None
+        message_timestamp = _ts_to_datetime(message_ts)
+        # 카메라 이벤트는 메시지 시각이 없으면 현재 시간 사용 (실시간 이벤트 처리)
+        if spec.now_if_missing and not message_timestamp:
+            return datetime.now(timezone.utc)
+        return message_timestamp
 
     async def process_pending_events(self):
         """초기화 완료 후 대기 중인 이벤트 처리"""
@@ -558,17 +552,18 @@ class SlackListener:
 
     async def restore_state_from_history(self, lookback_hours: int = 24):
         try:
+            self._ensure_http_session()
             # 디버깅: 현재 config 값 출력
 
             self.is_restoring = True
             self.joined_students_today.clear()
             self.last_event_times.clear()
+            self.event_times_inserts = 0
             self.logged_match_failures.clear()  # 매칭 실패 로그 기록 초기화
 
             await self._refresh_student_cache()
 
-            # monitor_service의 reset_time 사용 (UTC 기준)
-            now_utc = datetime.now(timezone.utc)
+            # monitor_service의 reset_time 사용 (UTC 기준), 없으면 로컬 날짜 기준으로 계산
             now_local = datetime.now()
 
             if self.monitor_service and self.monitor_service.reset_time:
@@ -603,95 +598,76 @@ class SlackListener:
                 today_reset_ts = oldest_dt.timestamp()
                 oldest_ts = oldest_dt.timestamp()
 
-            messages = []
-            cursor = None
-
-            while True:
-                response = await self.app.client.conversations_history(
-                    channel=config.SLACK_CHANNEL_ID,
-                    oldest=str(oldest_ts),
-                    limit=1000,
-                    cursor=cursor
-                )
-
-                if not response.get("ok"):
-                    error = response.get("error", "unknown_error")
-                    logger.warning(f"Slack 채널 조회 실패: {error}")
-                    break
-
-                batch = response.get("messages", [])
-                messages.extend(batch)
-
-                cursor = response.get("response_metadata", {}).get("next_cursor")
-                if not cursor:
-                    break
-
-            if not messages:
-                logger.info("[동기화] 메시지 없음 - 종료")
-                return
-            
-            messages.sort(key=lambda msg: float(msg.get("ts", 0)))
-            
+            message_count = 0
             processed_count = 0
             camera_on_count = 0
             camera_off_count = 0
             join_count = 0
             leave_count = 0
-            
-            for message in messages:
-                text = message.get("text", "")
-                if not text:
-                    text = self._extract_text_from_blocks(message)
-                if not text:
-                    continue
-                message_ts = float(message.get("ts", 0))
-                message_dt = datetime.fromtimestamp(message_ts, tz=timezone.utc) if message_ts > 0 else None
-
-                # 카메라 ON (한글 + 영어)
-                match_on = self.pattern_cam_on.search(text) or self.pattern_cam_on_en.search(text)
-                if match_on:
-                    zep_name_raw = match_on.group(1)
-                    zep_name = extract_name_only(zep_name_raw, role_keywords=self.role_keywords)
+            pages = []
+
+            # 페이지가 도착하는 대로 이벤트만 추출 (원본 메시지는 보관하지 않음)
+            async for batch in self._iter_history_pages(oldest_ts):
+                message_count += len(batch)
+                page_events = []
+
+                # 페이지 내부는 최신순이므로 뒤집어서 시간순으로 처리
+                for message in reversed(batch):
+                    text = message.get("text", "")
+                    if not text:
+                        text = self._extract_text_from_blocks(message)
+                    if not text:
+                        continue
+
+                    # 카메라 ON/OFF, 퇴장, 입장 (한글 + 영어) - 한 번의 검색으로 분류
+                    event = match_event(text)
+                    if not event:
+                        continue
+
+                    event_type, zep_name_raw = event
+                    message_ts = float(message.get("ts", 0))
                     add_to_joined = message_ts >= today_reset_ts
-                    await self._handle_camera_on(zep_name_raw, zep_name, message_dt, message_ts, add_to_joined_today=add_to_joined)
-                    camera_on_count += 1
+                    page_events.append((event_type, zep_name_raw, message_ts, add_to_joined))
+
+                    if event_type == "camera_on":
+                        camera_on_count += 1
+                    elif event_type == "camera_off":
+                        camera_off_count += 1
+                    elif event_type == "user_leave":
+                        leave_count += 1
+                    elif add_to_joined:
+                        join_count += 1
                     processed_count += 1
-                    continue
 
-                # 카메라 OFF (한글 + 영어)
-                match_off = self.pattern_cam_off.search(text) or self.pattern_cam_off_en.search(text)
-                if match_off:
-                    zep_name_raw = match_off.group(1)
-                    zep_name = extract_name_only(zep_name_raw, role_keywords=self.role_keywords)
-                    add_to_joined = message_ts >= today_reset_ts
-                    await self._handle_camera_off(zep_name_raw, zep_name, message_dt, message_ts, add_to_joined_today=add_to_joined)
-                    camera_off_count += 1
-                    processed_count += 1
-                    continue
+                pages.append(page_events)
 
-                # 퇴장 (한글 + 영어)
-                match_leave = self.pattern_leave.search(text) or self.pattern_leave_en.search(text)
-                if match_leave:
-                    zep_name_raw = match_leave.group(1)
-                    zep_name = extract_name_only(zep_name_raw, role_keywords=self.role_keywords)
-                    add_to_joined = message_ts >= today_reset_ts
-                    await self._handle_user_leave(zep_name_raw, zep_name, message_dt, message_ts, add_to_joined_today=add_to_joined)
-                    leave_count += 1
-                    processed_count += 1
-                    continue
+            if not message_count:
+                logger.info("[동기화] 메시지 없음 - 종료")
+                return
 
-                # 입장 (한글 + 영어)
-                match_join = self.pattern_join.search(text) or self.pattern_join_en.search(text)
-                if match_join:
-                    zep_name_raw = match_join.group(1)
-                    zep_name = extract_name_only(zep_name_raw, role_keywords=self.role_keywords)
-                    if message_ts >= today_reset_ts:
-                        await self._handle_user_join(zep_name_raw, zep_name, message_dt, message_ts)
-                        join_count += 1
-                    else:
-                        await self._handle_user_join(zep_name_raw, zep_name, message_dt, message_ts, add_to_joined_today=False)
-                    processed_count += 1
+            # 페이지는 최신 → 과거 순서로 도착하므로 역순으로 이어 붙이면 전체가 시간순
+            events = [event for page_events in reversed(pages) for event in page_events]
+
+            # 학생별로 이벤트를 시간순으로 접어 최종 컬럼 값만 한 번에 반영
+            student_updates: Dict[int, dict] = {}
+            for event_type, zep_name_raw, message_ts, add_to_joined in events:
+                student_id, _ = await self._resolve_student(zep_name_raw)
+                if not student_id:
+                    self._log_match_failure(event_type, zep_name_raw)
                     continue
+                if self._is_duplicate_event(student_id, event_type, message_ts):
+                    continue
+                if add_to_joined and _EVENT_SPECS[event_type].mark_joined:
+                    self.joined_students_today.add(student_id)
+                student_updates.setdefault(student_id, {}).update(
+                    self._replay_event_values(event_type, message_ts, add_to_joined)
+                )
+
+            await self.db_service.apply_student_updates(student_updates)
+            logger.info(
+                "[동기화] 이벤트 %d건 복원 (카메라 ON %d, 카메라 OFF %d, 입장 %d, 퇴장 %d)",
+                processed_count, camera_on_count, camera_off_count, join_count, leave_count
+            )
 
             # 백엔드 재시작/동기화 시: 응답 관련 필드만 초기화 (쿨다운 타이머는 유지)
             await self.db_service.reset_alert_fields_partial()
@@ -727,18 +703,68 @@ class SlackListener:
                 await self.monitor_service.broadcast_dashboard_update_now()
             
         except Exception as e:
-            import traceback
             logger.error(f"[restore_state_from_history 오류] {e}", exc_info=True)
-            traceback.print_exc()
         finally:
             self.is_restoring = False
+            self.resolved_names.clear()
     
+    async def _iter_history_pages(self, oldest_ts: float):
+        """
+        채널 히스토리를 페이지 단위로 조회 (다음 페이지를 미리 요청)
+
+        Slack은 최신 메시지부터 반환하므로 페이지도 최신 → 과거 순서로 전달됩니다.
+
+        Args:
+            oldest_ts: 조회 시작 시각 (Unix timestamp)
+        """
+        def fetch(cursor: Optional[str]):
+            return asyncio.create_task(self.app.client.conversations_history(
+                channel=config.SLACK_CHANNEL_ID,
+                oldest=str(oldest_ts),
+                limit=1000,
+                cursor=cursor
+            ))
+
+        pending = fetch(None)
+        try:
+            while pending:
+                response = await pending
+                pending = None
+
+                if not response.get("ok"):
+                    error = response.get("error", "unknown_error")
+                    logger.warning(f"Slack 채널 조회 실패: {error}")
+                    return
+
+                cursor = response.get("response_metadata", {}).get("next_cursor")
+                if cursor:
+                    pending = fetch(cursor)
+
+                yield response.get("messages", [])
+        finally:
+            if pending:
+                pending.cancel()
+
     def get_joined_students_today(self) -> set:
         return self.joined_students_today
     
+    def _ensure_http_session(self):
+        """
+        Slack Web API 호출에 재사용할 HTTP 세션 연결
+
+        세션을 지정하지 않으면 slack_sdk가 요청마다 세션과 TLS 연결을 새로 만들므로,
+        히스토리 페이지 조회와 5초 간격 폴링이 같은 keep-alive 연결을 쓰도록 공유합니다.
+        """
+        if self.http_session is None or self.http_session.closed:
+            self.http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=60)
+            )
+            self.app.client.session = self.http_session
+
     async def start(self):
         """Slack 리스너 시작 (동기화 포함)"""
         try:
+            self._ensure_http_session()
             self.handler = AsyncSocketModeHandler(
                 self.app,
                 config.SLACK_APP_TOKEN
@@ -783,6 +809,8 @@ class SlackListener:
     async def start_listener(self):
         """Socket Mode 리스너만 시작 (동기화 제외)"""
         try:
+            self._ensure_http_session()
+            self._start_workers()
             if not self.handler:
                 self.handler = AsyncSocketModeHandler(
                     self.app,
@@ -792,13 +820,11 @@ class SlackListener:
             # 폴링 태스크 시작 (백그라운드)
             if not self.polling_task or self.polling_task.done():
                 self.polling_task = asyncio.create_task(self._poll_missing_messages())
-                print(f"[폴링 시작] {self.polling_interval}초 간격으로 누락 메시지 체크")
                 logger.info(f"[폴링 시작] {self.polling_interval}초 간격으로 누락 메시지 체크")
 
             # 주기 동기화 태스크 시작 (백그라운드)
             if not self.periodic_sync_task or self.periodic_sync_task.done():
                 self.periodic_sync_task = asyncio.create_task(self._periodic_sync())
-                print(f"[주기 동기화 시작] {self.periodic_sync_interval // 60}분 간격으로 상태 재동기화")
                 logger.info(f"[주기 동기화 시작] {self.periodic_sync_interval // 60}분 간격으로 상태 재동기화")
 
             await self.handler.start_async()
@@ -812,7 +838,7 @@ class SlackListener:
                 await asyncio.sleep(self.polling_interval)
 
                 # 마지막 폴링 이후의 메시지만 조회
-                now_ts = datetime.now().timestamp()
+                now_ts = time.time()
 
                 # 일반 채널 폴링
                 response = await self.app.client.conversations_history(
@@ -842,8 +868,8 @@ class SlackListener:
                         if message_ts <= self.last_poll_timestamp:
                             continue
 
-                        # 메시지 처리
-                        await self._process_message_async(text, message_ts)
+                        # 메시지 처리 (실시간 메시지와 같은 큐로 순서 유지)
+                        self._enqueue_message(text, message_ts)
                         processed_count += 1
 
                     if processed_count > 0:
@@ -945,6 +971,15 @@ class SlackListener:
         return message.get("text", "")
 
     async def stop(self):
+        # 메시지/브로드캐스트 워커 종료
+        for task in (self.message_worker_task, self.broadcast_worker_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
         # 폴링 태스크 종료
         if self.polling_task and not self.polling_task.done():
             self.polling_task.cancel()
@@ -963,3 +998,7 @@ class SlackListener:
 
         if self.handler:
             await self.handler.close_async()
+
+        if self.http_session and not self.http_session.closed:
+            await self.http_session.close()
+            self.app.client.session = None
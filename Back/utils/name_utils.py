@@ -4,10 +4,11 @@ Shared name parsing helpers.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Iterable, Sequence
 
 
-DEFAULT_ROLE_KEYWORDS = {
+DEFAULT_ROLE_KEYWORDS = frozenset({
     "조교",
     "주강사",
     "멘토",
@@ -26,26 +27,28 @@ DEFAULT_ROLE_KEYWORDS = {
     "실습",
     "프로젝트",
     "팀",
-}
+})
 
 
 _PARTS_PATTERN = re.compile(r"[/_\-|\s.()@{}\[\]\*]+")
 _PARTS_PATTERN_ALL = re.compile(r"[/_\-|\s.()@{}\[\]!\*]+")
+_HANGUL_PATTERN = re.compile(r"[\uAC00-\uD7A3]+")
 
 
-def _normalize_role_keywords(role_keywords: Sequence[str] | None) -> set[str]:
+def _normalize_role_keywords(role_keywords: Sequence[str] | None) -> frozenset[str]:
     if role_keywords is None:
-        return set(DEFAULT_ROLE_KEYWORDS)
-    return {str(keyword) for keyword in role_keywords if keyword}
+        return DEFAULT_ROLE_KEYWORDS
+    if isinstance(role_keywords, frozenset):
+        return role_keywords
+    return frozenset(str(keyword) for keyword in role_keywords if keyword)
 
 
 def _extract_korean_parts(parts: Iterable[str]) -> list[str]:
     korean_parts: list[str] = []
     for part in parts:
-        if any("\uAC00" <= char <= "\uD7A3" for char in part):
-            korean_only = "".join(c for c in part if "\uAC00" <= c <= "\uD7A3")
-            if korean_only:
-                korean_parts.append(korean_only)
+        korean_only = "".join(_HANGUL_PATTERN.findall(part))
+        if korean_only:
+            korean_parts.append(korean_only)
     return korean_parts
 
 
@@ -58,12 +61,21 @@ def extract_name_only(
     """Extract the primary Korean name from a ZEP name."""
     if not zep_name:
         return ""
+    return _extract_name_only_cached(
+        zep_name, _normalize_role_keywords(role_keywords), fallback_to_first_part
+    )
 
+
+@lru_cache(maxsize=4096)
+def _extract_name_only_cached(
+    zep_name: str,
+    role_keywords_set: frozenset[str],
+    fallback_to_first_part: bool,
+) -> str:
     cleaned = zep_name.strip("*").strip()
     parts = [part.strip() for part in _PARTS_PATTERN.split(cleaned) if part.strip()]
 
     korean_parts = _extract_korean_parts(parts)
-    role_keywords_set = _normalize_role_keywords(role_keywords)
     filtered = [part for part in korean_parts if part not in role_keywords_set]
 
     if filtered:
@@ -79,19 +91,25 @@ def extract_all_korean_names(
     zep_name: str,
     *,
     role_keywords: Sequence[str] | None = None,
-) -> list[str]:
+) -> tuple[str, ...]:
     """Extract all candidate Korean names in reverse order."""
     if not zep_name:
-        return []
+        return ()
+    return _extract_all_korean_names_cached(zep_name, _normalize_role_keywords(role_keywords))
 
+
+@lru_cache(maxsize=4096)
+def _extract_all_korean_names_cached(
+    zep_name: str,
+    role_keywords_set: frozenset[str],
+) -> tuple[str, ...]:
     cleaned = zep_name.strip("*").strip()
     parts = [part.strip() for part in _PARTS_PATTERN_ALL.split(cleaned) if part.strip()]
 
     korean_parts = _extract_korean_parts(parts)
-    role_keywords_set = _normalize_role_keywords(role_keywords)
     filtered = [part for part in korean_parts if part not in role_keywords_set]
     target_parts = filtered if filtered else korean_parts
 
     if target_parts:
-        return list(reversed(target_parts))
-    return [cleaned]
+        return tuple(reversed(target_parts))
+    return (cleaned,)